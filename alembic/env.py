@@ -9,6 +9,8 @@ from alembic import context
 
 # Add the src directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Make migration_helpers importable from revision scripts
+sys.path.insert(0, os.path.dirname(__file__))
 
 # Import your models here
 from src.database import Base
@@ -19,8 +21,11 @@ from src.models import User, AIModel, AudioFile, Transcription, Translation, Sum
 config = context.config
 
 # Interpret the config file for Python logging.
-# This line sets up loggers basically.
-if config.config_file_name is not None:
+# This line sets up loggers basically. Skipped when migrations are run
+# in-process by the application, which has its own logging setup.
+if config.config_file_name is not None and config.attributes.get(
+    "configure_logger", True
+):
     fileConfig(config.config_file_name)
 
 # add your model's MetaData object here
@@ -53,6 +58,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -77,7 +83,11 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            # Commit after each revision so catalog locks (e.g. on ai_models)
+            # are released early instead of held for the whole upgrade.
+            transaction_per_migration=True,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,67 @@
+"""Helpers shared by migration scripts.
+
+env.py puts this directory on sys.path, so revisions can simply
+``from migration_helpers import ...``.
+"""
+
+from typing import FrozenSet, Optional
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine.reflection import Inspector
+
+_INSPECTOR_KEY = "alembic_shared_inspector"
+_COLUMNS_KEY = "alembic_column_cache"
+
+# Cheap catalog version of a table: any ADD/DROP/ALTER COLUMN rewrites its
+# pg_attribute rows and bumps their xmin. NULL when the table doesn't exist.
+_CATALOG_VERSION_SQL = sa.text(
+    "SELECT max(xmin::text::bigint) FROM pg_attribute "
+    "WHERE attrelid = to_regclass(:table)"
+)
+
+# The 'operation' enum type used by ai_models. create_type=False: revisions
+# create/drop the type explicitly, so add_column and friends must not
+# emit their own CREATE TYPE (and its pg_type existence check).
+OPERATION_ENUM = postgresql.ENUM(
+    "transcription", "translation", "summary", name="operation", create_type=False
+)
+
+
+def get_shared_inspector(conn: Connection) -> Inspector:
+    """Return one Inspector per connection for the whole ``alembic upgrade`` run.
+
+    Every revision in a run shares the same connection, so keeping the
+    Inspector in ``conn.info`` lets later revisions hit its ``info_cache``
+    instead of re-running the same reflection queries.
+
+    A revision that changes the schema must call ``inspector.clear_cache()``
+    afterwards so later revisions don't see stale reflection results.
+    """
+    inspector = conn.info.get(_INSPECTOR_KEY)
+    if inspector is None:
+        inspector = sa.inspect(conn)
+        conn.info[_INSPECTOR_KEY] = inspector
+    return inspector
+
+
+def get_column_names(conn: Connection, table: str) -> Optional[FrozenSet[str]]:
+    """Return the column names of ``table``, or None if it doesn't exist.
+
+    Results are cached in ``conn.info`` under the table's catalog version,
+    so repeated checks across revisions cost one small catalog query and
+    reflection only runs again after the table's columns actually change.
+    """
+    version = conn.scalar(_CATALOG_VERSION_SQL, {"table": table})
+    if version is None:
+        return None
+    cache = conn.info.setdefault(_COLUMNS_KEY, {})
+    cached = cache.get(table)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    inspector = get_shared_inspector(conn)
+    inspector.clear_cache()
+    columns = frozenset(c["name"] for c in inspector.get_columns(table))
+    cache[table] = (version, columns)
+    return columns
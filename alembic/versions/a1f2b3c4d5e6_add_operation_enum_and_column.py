@@ -11,6 +11,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from migration_helpers import OPERATION_ENUM, get_column_names
+
 
 # revision identifiers, used by Alembic.
 revision: str = "a1f2b3c4d5e6"
@@ -22,29 +24,46 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     """Upgrade schema: create enum type and add operation column."""
 
-    # Create new enum type 'operation' if it doesn't exist
-    op.execute(
-        "DO $$ BEGIN IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'operation') THEN CREATE TYPE operation AS ENUM ('transcription','translation','summary'); END IF; END $$;"
-    )
+    conn = op.get_bind()
 
-    # Add nullable operation column using the new enum type if table exists
-    operation_enum = sa.Enum('transcription', 'translation', 'summary', name='operation')
+    # Create new enum type 'operation'; a concurrent or repeated run hits
+    # duplicate_object (SQLSTATE 42710), which the savepoint absorbs.
+    try:
+        with conn.begin_nested():
+            OPERATION_ENUM.create(conn, checkfirst=False)
+    except sa.exc.ProgrammingError as exc:
+        if getattr(exc.orig, "pgcode", None) != "42710":
+            raise
+
+    # Column names are cached for the whole run and only re-reflected when
+    # the table's catalog version changes.
+    columns = get_column_names(conn, 'ai_models')
     # Only add the column if the table exists and column is not present
-    conn = op.get_bind()
-    inspector = sa.inspect(conn)
-    if 'ai_models' in inspector.get_table_names():
-        columns = [c['name'] for c in inspector.get_columns('ai_models')]
+    if columns is not None:
         if 'operation' not in columns:
+            # Add the column NOT NULL in one statement: with a constant default
+            # PostgreSQL fills existing rows without a rewrite or a second
+            # NOT NULL validation scan.
             op.add_column(
                 'ai_models',
-                sa.Column('operation', operation_enum, nullable=True),
+                sa.Column(
+                    'operation',
+                    OPERATION_ENUM,
+                    nullable=False,
+                    server_default='transcription',
+                ),
             )
 
-            # If database already had data and an 'operations' ARRAY column, migration
-            # would need to copy values; for an empty DB this step is not necessary.
+            # Carry over values from the legacy 'operations' ARRAY column
+            # (first element) in one set-based statement.
+            if 'operations' in columns:
+                op.execute(
+                    "UPDATE ai_models SET operation = operations[1]::operation "
+                    "WHERE operations IS NOT NULL AND array_length(operations, 1) >= 1"
+                )
 
-            # Make the column non-nullable to match the model contract
-            op.alter_column('ai_models', 'operation', nullable=False)
+            # The model has no server-side default; drop it (catalog-only change)
+            op.alter_column('ai_models', 'operation', server_default=None)
 
 
 def downgrade() -> None:
@@ -52,8 +71,7 @@ def downgrade() -> None:
 
     # Add back an 'operations' column as ARRAY of enum (best-effort)
     try:
-        operations_enum = sa.Enum('transcription', 'translation', 'summary', name='operation')
-        op.add_column('ai_models', sa.Column('operations', sa.ARRAY(operations_enum), nullable=True))
+        op.add_column('ai_models', sa.Column('operations', sa.ARRAY(OPERATION_ENUM), nullable=True))
     except Exception:
         # If adding fails, continue with best-effort downgrade
         pass
@@ -0,0 +1,35 @@
+"""Add (filter column, id) indexes for keyset pagination of list endpoints
+
+Revision ID: a3b4c5d6e7f8
+Revises: f2a3b4c5d6e7
+Create Date: 2025-09-08 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a3b4c5d6e7f8"
+down_revision: Union[str, Sequence[str], None] = "f2a3b4c5d6e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_audio_files_user_id_id", "audio_files", ["user_id", "id"], unique=False)
+    op.create_index("ix_transcriptions_status_id", "transcriptions", ["status", "id"], unique=False)
+    op.create_index(
+        "ix_transcriptions_audio_file_id_id", "transcriptions", ["audio_file_id", "id"], unique=False
+    )
+    op.create_index("ix_summaries_status_id", "summaries", ["status", "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_summaries_status_id", table_name="summaries")
+    op.drop_index("ix_transcriptions_audio_file_id_id", table_name="transcriptions")
+    op.drop_index("ix_transcriptions_status_id", table_name="transcriptions")
+    op.drop_index("ix_audio_files_user_id_id", table_name="audio_files")
@@ -0,0 +1,45 @@
+"""Add CASCADE DELETE for rows produced by an AI model
+
+Revision ID: c7d8e9f0a1b2
+Revises: d4e5f6g7h8i9
+Create Date: 2025-09-08 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d8e9f0a1b2"
+down_revision: Union[str, Sequence[str], None] = "d4e5f6g7h8i9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose ai_model_id references ai_models.id
+_TABLES = ("transcriptions", "translations", "summaries")
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Let PostgreSQL remove transcriptions, translations and summaries of a
+    deleted AI model in the same DELETE instead of the ORM loading and
+    deleting each child row.
+    """
+    for table in _TABLES:
+        op.drop_constraint(op.f(f"{table}_ai_model_id_fkey"), table, type_="foreignkey")
+        op.create_foreign_key(
+            op.f(f"{table}_ai_model_id_fkey"), table, "ai_models",
+            ["ai_model_id"], ["id"], ondelete="CASCADE",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in _TABLES:
+        op.drop_constraint(op.f(f"{table}_ai_model_id_fkey"), table, type_="foreignkey")
+        op.create_foreign_key(
+            op.f(f"{table}_ai_model_id_fkey"), table, "ai_models",
+            ["ai_model_id"], ["id"],
+        )
@@ -10,6 +10,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from migration_helpers import OPERATION_ENUM
+
 
 # revision identifiers, used by Alembic.
 revision: str = "d4e5f6g7h8i9"
@@ -19,14 +21,23 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    """Remove the legacy 'operations' column if present."""
-    conn = op.get_bind()
-    inspector = sa.inspect(conn)
-    if 'ai_models' in inspector.get_table_names():
-        cols = [c['name'] for c in inspector.get_columns('ai_models')]
-        if 'operations' in cols:
-            # use IF EXISTS to be safe if concurrent state differs
-            op.execute('ALTER TABLE ai_models DROP COLUMN IF EXISTS operations;')
+    """Bring ai_models to its final shape: 'operation' present, 'operations' gone.
+
+    a1f2b3c4d5e6 sits on a parallel branch and may run before ai_models is
+    created (fresh install), in which case it never adds 'operation'. This
+    merge-point revision finishes the job for that path, so the ADD and the
+    DROP happen together instead of in separate passes over the table.
+    """
+    # One multi-action ALTER: PostgreSQL applies all actions under a single
+    # lock. The IF [NOT] EXISTS clauses make it idempotent without reflection
+    # round-trips; the constant default fills existing rows without a rewrite.
+    op.execute(
+        "ALTER TABLE IF EXISTS ai_models "
+        "ADD COLUMN IF NOT EXISTS operation operation NOT NULL DEFAULT 'transcription', "
+        "DROP COLUMN IF EXISTS operations;"
+    )
+    # The model has no server-side default (catalog-only change)
+    op.execute('ALTER TABLE IF EXISTS ai_models ALTER COLUMN operation DROP DEFAULT;')
 
 
 def downgrade() -> None:
@@ -35,9 +46,8 @@ def downgrade() -> None:
     This best-effort downgrade recreates the column (nullable) so downgrade won't fail,
     but it doesn't repopulate previous values.
     """
-    operation_enum = sa.Enum('transcription', 'translation', 'summary', name='operation')
     try:
-        op.add_column('ai_models', sa.Column('operations', sa.ARRAY(operation_enum), nullable=True))
+        op.add_column('ai_models', sa.Column('operations', sa.ARRAY(OPERATION_ENUM), nullable=True))
     except Exception:
         # best-effort: if add fails (e.g., table missing) ignore
         pass
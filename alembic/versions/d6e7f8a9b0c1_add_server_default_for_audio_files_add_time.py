@@ -0,0 +1,40 @@
+"""Add server default now() for audio_files.add_time
+
+Revision ID: d6e7f8a9b0c1
+Revises: c5d6e7f8a9b0
+Create Date: 2025-09-09 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d6e7f8a9b0c1"
+down_revision: Union[str, Sequence[str], None] = "c5d6e7f8a9b0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "audio_files",
+        "add_time",
+        existing_type=sa.DateTime(),
+        existing_nullable=False,
+        server_default=sa.text("now()"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "audio_files",
+        "add_time",
+        existing_type=sa.DateTime(),
+        existing_nullable=False,
+        server_default=None,
+    )
@@ -0,0 +1,38 @@
+"""Drop single-column indexes superseded by composite indexes
+
+Revision ID: e7f8a9b0c1d2
+Revises: d6e7f8a9b0c1
+Create Date: 2025-09-09 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7f8a9b0c1d2"
+down_revision: Union[str, Sequence[str], None] = "d6e7f8a9b0c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Covered by the leading column of ix_audio_files_user_id_id
+    op.drop_index(op.f("ix_audio_files_user_id"), table_name="audio_files")
+    # Covered by the leading column of ix_transcriptions_audio_file_id_id
+    op.drop_index(op.f("ix_transcriptions_audio_file_id"), table_name="transcriptions")
+    # Covered by the leading column of ix_translations_transcription_status
+    op.drop_index(op.f("ix_translations_transcription_id"), table_name="translations")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f("ix_translations_transcription_id"), "translations", ["transcription_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_transcriptions_audio_file_id"), "transcriptions", ["audio_file_id"], unique=False
+    )
+    op.create_index(op.f("ix_audio_files_user_id"), "audio_files", ["user_id"], unique=False)
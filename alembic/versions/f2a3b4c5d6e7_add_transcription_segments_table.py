@@ -0,0 +1,36 @@
+"""Add transcription_segments table
+
+Revision ID: f2a3b4c5d6e7
+Revises: c7d8e9f0a1b2
+Create Date: 2025-09-08 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a3b4c5d6e7"
+down_revision: Union[str, Sequence[str], None] = "c7d8e9f0a1b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('transcription_segments',
+    sa.Column('audio_file_id', sa.Integer(), nullable=False),
+    sa.Column('start_times', postgresql.ARRAY(sa.Float()), nullable=False),
+    sa.Column('end_times', postgresql.ARRAY(sa.Float()), nullable=False),
+    sa.Column('texts', postgresql.ARRAY(sa.String()), nullable=False),
+    sa.ForeignKeyConstraint(['audio_file_id'], ['audio_files.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('audio_file_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('transcription_segments')
@@ -0,0 +1,44 @@
+"""Backfill transcription_segments for existing transcriptions
+
+Revision ID: f8a9b0c1d2e3
+Revises: e7f8a9b0c1d2
+Create Date: 2025-09-09 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f8a9b0c1d2e3"
+down_revision: Union[str, Sequence[str], None] = "e7f8a9b0c1d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Segments are now rebuilt on every transcription write instead of on
+    # first read, so rows for already existing transcriptions are built here
+    op.execute(
+        """
+        INSERT INTO transcription_segments (audio_file_id, start_times, end_times, texts)
+        SELECT audio_file_id,
+               array_agg(start_time ORDER BY id),
+               array_agg(end_time ORDER BY id),
+               array_agg(text_transcription ORDER BY id)
+        FROM transcriptions
+        GROUP BY audio_file_id
+        ON CONFLICT (audio_file_id) DO UPDATE
+        SET start_times = EXCLUDED.start_times,
+            end_times = EXCLUDED.end_times,
+            texts = EXCLUDED.texts
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The rows are a derived cache; the previous code rebuilds them on read
+    pass
@@ -1,17 +1,41 @@
-from .database import Base, engine, get_db  # explicit imports for re-export
+from typing import Any
+
+from .database import (  # explicit imports for re-export
+    Base,
+    enable_lazy_load_warnings,
+    get_async_db,
+    get_async_engine,
+    get_db,
+    get_engine,
+    is_foreign_key_violation,
+)
 from .health_check import (
     ApplicationHealthChecker,
     check_application_health,
     ensure_application_ready,
+    get_health_checker,
     print_health_report,
 )
 
 __all__ = [
     "Base",
+    "enable_lazy_load_warnings",
     "engine",
+    "get_async_db",
+    "get_async_engine",
     "get_db",
+    "get_engine",
+    "is_foreign_key_violation",
     "ApplicationHealthChecker",
     "check_application_health",
     "ensure_application_ready",
+    "get_health_checker",
     "print_health_report",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # `engine` is created lazily on first access (PEP 562)
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
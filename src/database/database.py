@@ -5,37 +5,266 @@
 создание движка SQLAlchemy, сессий и базового класса для моделей.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+import logging
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Dict, Generator, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase, ORMExecuteState, sessionmaker, Session
 import os
 
-# URL для подключения к базе данных PostgreSQL
-# Использует переменные окружения для гибкости
-DATABASE_URL = f"postgresql://{os.getenv('POSTGRES_USER', 'postgres')}:{os.getenv('POSTGRES_PASSWORD', 'postgres')}@{os.getenv('DB_HOST', 'localhost')}/{os.getenv('POSTGRES_DB', 'audioscrobeai')}"
+# `engine` намеренно не входит в __all__: он создаётся лениво через get_engine()
+__all__ = [
+    "Base",
+    "enable_lazy_load_warnings",
+    "get_async_db",
+    "get_async_engine",
+    "get_database_url",
+    "get_db",
+    "get_engine",
+    "is_foreign_key_violation",
+]
+
+logger = logging.getLogger(__name__)
+
+# Размеры пулов соединений задаются на один процесс (воркер uvicorn).
+# Каждый воркер держит до
+#   DB_POOL_SIZE + DB_POOL_OVERFLOW + DB_ASYNC_POOL_SIZE + DB_ASYNC_POOL_OVERFLOW
+# соединений (по умолчанию 15 + 5 = 20), поэтому сумма по всем воркерам
+# (и по всем экземплярам приложения) должна оставаться меньше
+# max_connections PostgreSQL (по умолчанию 100) за вычетом соединений
+# миграций и администрирования. Например, при 4 воркерах по умолчанию — 80.
+# Для большего числа воркеров уменьшайте значения или ставьте пулер
+# соединений (PgBouncer, см. DB_PORT)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_POOL_OVERFLOW = int(os.getenv("DB_POOL_OVERFLOW", "10"))
+DB_ASYNC_POOL_SIZE = int(os.getenv("DB_ASYNC_POOL_SIZE", "2"))
+DB_ASYNC_POOL_OVERFLOW = int(os.getenv("DB_ASYNC_POOL_OVERFLOW", "3"))
+# Наибольшее число соединений синхронного пула: по нему же ограничивается
+# пул потоков синхронных эндпоинтов (см. src.main)
+DB_POOL_MAX_CONNECTIONS = DB_POOL_SIZE + DB_POOL_OVERFLOW
+# Ожидание свободного соединения и максимальный возраст соединения, секунды
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "10"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+# Общие параметры пула для синхронного и асинхронного движков
+# (размеры пулов задаются для каждого движка отдельно)
+_POOL_OPTIONS: Dict[str, Any] = {
+    # Проверка соединения перед выдачей из пула и переподключение
+    # до того, как PostgreSQL закроет простаивающее соединение
+    "pool_pre_ping": True,
+    "pool_recycle": DB_POOL_RECYCLE,
+    # Не ждать свободного соединения дольше 10 секунд (по умолчанию 30)
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "query_cache_size": 1200,
+}
+
+# SQLSTATE нарушения внешнего ключа (foreign_key_violation)
+_FOREIGN_KEY_VIOLATION = "23503"
+
+# Реестр движков по URL: один пул на одну базу данных в пределах процесса
+_ENGINES: Dict[str, Engine] = {}
+
+
+@lru_cache(maxsize=1)
+def get_database_url() -> URL:
+    """
+    Собирает URL для подключения к базе данных PostgreSQL.
+
+    Использует переменные окружения для гибкости. URL.create не требует
+    экранирования спецсимволов (`@`, `:`) в пароле и разбора строки.
+    DB_PORT позволяет подключаться через пулер соединений (например,
+    PgBouncer на порту 6432) без изменения кода.
+
+    Returns:
+        URL: URL подключения к БД.
+    """
+    env = os.environ
+    url = URL.create(
+        drivername="postgresql",
+        username=env.get("POSTGRES_USER", "postgres"),
+        password=env.get("POSTGRES_PASSWORD", "postgres"),
+        host=env.get("DB_HOST", "localhost"),
+        port=int(env["DB_PORT"]) if env.get("DB_PORT") else None,
+        database=env.get("POSTGRES_DB", "audioscrobeai"),
+    )
+    logger.info(
+        f"База данных: {url.host}:{url.port or 5432}/{url.database} "
+        f"(пользователь {url.username})"
+    )
+    return url
+
+
+def get_engine(url: Optional[URL] = None) -> Engine:
+    """
+    Возвращает движок SQLAlchemy для `url`, создавая его при первом обращении.
+
+    Движки кэшируются по URL, поэтому повторные запросы одной и той же
+    базы (например, реплики) не создают дополнительных пулов. Импорт
+    модуля (например, ради `Base` в Alembic) не создаёт движок и пул.
+
+    Args:
+        url: URL базы данных; по умолчанию — основная БД приложения.
+
+    Returns:
+        Engine: Движок для подключения к БД.
+    """
+    if url is None:
+        url = get_database_url()
+    key = url.render_as_string(hide_password=False)
+    engine = _ENGINES.get(key)
+    if engine is None:
+        # create_engine не открывает соединений, поэтому при гонке
+        # лишний экземпляр просто отбрасывается.
+        # values_plus_batch: executemany для INSERT собирается в многострочные
+        # VALUES, а для UPDATE/DELETE выполняется пачками (psycopg2 execute_batch)
+        engine = _ENGINES.setdefault(
+            key,
+            create_engine(
+                url,
+                executemany_mode="values_plus_batch",
+                pool_size=DB_POOL_SIZE,
+                max_overflow=DB_POOL_OVERFLOW,
+                **_POOL_OPTIONS,
+            ),
+        )
+    return engine
+
+
+@lru_cache(maxsize=1)
+def _session_factory() -> "sessionmaker[Session]":
+    """Фабрика сессий для работы с БД (создаётся лениво)."""
+    # expire_on_commit=False: объекты остаются загруженными после commit,
+    # без повторных SELECT при чтении атрибутов в обработчике
+    return sessionmaker(
+        autocommit=False, autoflush=False, expire_on_commit=False, bind=get_engine()
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    """
+    Возвращает асинхронный движок (драйвер asyncpg), создавая его лениво.
+
+    Returns:
+        AsyncEngine: Асинхронный движок для подключения к БД.
+    """
+    return create_async_engine(
+        get_database_url().set(drivername="postgresql+asyncpg"),
+        pool_size=DB_ASYNC_POOL_SIZE,
+        max_overflow=DB_ASYNC_POOL_OVERFLOW,
+        **_POOL_OPTIONS,
+    )
+
+
+@lru_cache(maxsize=1)
+def _async_session_factory() -> "async_sessionmaker[AsyncSession]":
+    """Фабрика асинхронных сессий (создаётся лениво)."""
+    return async_sessionmaker(
+        get_async_engine(), autoflush=False, expire_on_commit=False
+    )
+
+
+def is_foreign_key_violation(error: IntegrityError) -> bool:
+    """
+    Проверяет, вызвана ли ошибка нарушением внешнего ключа.
+
+    Позволяет не проверять существование родительской записи отдельным
+    запросом перед INSERT: отсутствие родителя отклонит сама БД.
+
+    Args:
+        error: Ошибка целостности от SQLAlchemy.
+
+    Returns:
+        bool: True, если нарушен внешний ключ.
+    """
+    return getattr(error.orig, "pgcode", None) == _FOREIGN_KEY_VIOLATION
+
+
+def _warn_lazy_load(orm_execute_state: ORMExecuteState) -> None:
+    """Пишет предупреждение о ленивой загрузке связи (возможный N+1)."""
+    state = orm_execute_state.lazy_loaded_from
+    if state is not None:
+        logger.warning(
+            f"Ленивая загрузка связи у {state.class_.__name__}: возможен N+1, "
+            f"используйте selectinload/joinedload"
+        )
+
+
+def enable_lazy_load_warnings() -> None:
+    """
+    Включает предупреждения о ленивой загрузке связей во всех сессиях.
+
+    Предназначено для разработки: каждая ленивая загрузка пишется в лог,
+    чтобы N+1 в эндпоинтах было видно сразу. Повторный вызов безопасен.
+    """
+    if not event.contains(Session, "do_orm_execute", _warn_lazy_load):
+        event.listen(Session, "do_orm_execute", _warn_lazy_load)
+
 
-# Создание движка SQLAlchemy для подключения к БД
-engine = create_engine(DATABASE_URL)
+class Base(DeclarativeBase):
+    """Базовый класс для всех моделей SQLAlchemy."""
 
-# Фабрика сессий для работы с БД
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Базовый класс для всех моделей SQLAlchemy
-Base = declarative_base()
+def __getattr__(name: str) -> Any:
+    # Обратная совместимость: `engine` и `SessionLocal` создаются по требованию
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return _session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def get_db() -> Generator[Session, None, None]:
     """
     Генератор для получения сессии базы данных.
 
     Используется как зависимость в FastAPI для автоматического
-    управления сессиями.
+    управления сессиями. Изменения фиксируют сами обработчики
+    (`db.commit()` до возврата ответа): код после `yield` выполняется
+    уже после отправки ответа, и ошибка commit там не дошла бы до
+    клиента. По завершении запроса незафиксированная транзакция
+    откатывается, а сессия закрывается.
+
+    FastAPI кэширует зависимость в пределах запроса, поэтому все
+    `Depends(get_db)` одного запроса получают одну и ту же сессию.
 
     Yields:
         Session: Сессия базы данных.
     """
-    db = SessionLocal()
+    db = _session_factory()()
     try:
         yield db
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Асинхронный генератор сессии базы данных.
+
+    Зависимость FastAPI для async-эндпоинтов: запросы выполняются
+    через `await`, не занимая поток из пула потоков. Синхронный
+    `get_db` остаётся для ещё не переведённых эндпоинтов. Как и там,
+    изменения фиксирует сам обработчик.
+
+    Yields:
+        AsyncSession: Асинхронная сессия базы данных.
+    """
+    async with _async_session_factory()() as db:
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
@@ -5,21 +5,81 @@
 существования таблиц, настроек окружения и других системных зависимостей.
 """
 
+import io
 import logging
 import os
+import signal
 import subprocess
 import sys
-from typing import Any, Dict, List
-
-from sqlalchemy import inspect, text
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from sqlalchemy import inspect, select, text
+from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
 
-from src.database import Base, engine
+from src.database import Base, get_engine
 from src.models.users import User
 
 # Настройка логирования
 logger = logging.getLogger(__name__)
 
+# Таймаут выполнения миграций (5 минут)
+MIGRATION_TIMEOUT_SECONDS = 300
+
+# Корневая директория проекта (с alembic.ini), вычисляется один раз
+_PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+_ALEMBIC_INI = os.path.join(_PROJECT_ROOT, "alembic.ini")
+
+# Обязательные переменные окружения и допустимые значения настроек
+_REQUIRED_ENV_VARS: Tuple[str, ...] = (
+    "POSTGRES_DB",
+    "POSTGRES_USER",
+    "POSTGRES_PASSWORD",
+    "DB_HOST",
+    "SECRET_KEY",
+    "DEBUG",
+    "APP_ENV",
+)
+_VALID_APP_ENVS: FrozenSet[str] = frozenset({"development", "production", "testing"})
+_VALID_DEBUG: FrozenSet[str] = frozenset({"true", "false"})
+_SETTINGS_CHECKED: Tuple[str, ...] = ("APP_ENV", "SECRET_KEY", "DEBUG")
+
+# Проверка прав на запись: создание, заполнение и удаление временной таблицы
+_PERMISSIONS_CHECK_SQL = """
+DO $$
+BEGIN
+    CREATE TEMP TABLE test_permissions (id SERIAL PRIMARY KEY);
+    INSERT INTO test_permissions DEFAULT VALUES;
+    DROP TABLE test_permissions;
+END
+$$;
+"""
+
+
+@lru_cache(maxsize=1)
+def _expected_tables() -> tuple[str, ...]:
+    """
+    Возвращает имена таблиц всех ORM-моделей.
+
+    Набор моделей фиксирован после импорта, поэтому вычисляется один раз.
+    Должна вызываться после импорта всех моделей — это гарантирует импорт
+    `src.models.users` выше (пакет `src.models` импортирует все модели).
+    """
+    # Some Base subclasses may not be direct ORM mapped classes; filter those with __tablename__
+    return tuple(
+        table.__tablename__
+        for table in Base.__subclasses__()
+        if hasattr(table, "__tablename__")
+    )
+
 
 class ApplicationHealthChecker:
     """
@@ -28,17 +88,22 @@ class ApplicationHealthChecker:
     Проверяет базу данных, настройки окружения и системные зависимости.
     """
 
-    def __init__(self) -> None:
-        self.engine = engine
-        self.required_env_vars = [
-            "POSTGRES_DB",
-            "POSTGRES_USER",
-            "POSTGRES_PASSWORD",
-            "DB_HOST",
-            "SECRET_KEY",
-            "DEBUG",
-            "APP_ENV",
-        ]
+    def __init__(self, cache_ttl_seconds: float = 5.0) -> None:
+        """
+        Args:
+            cache_ttl_seconds: Время жизни кэша результатов полной,
+                liveness- и readiness-проверок.
+        """
+        self.engine = get_engine()
+        self.cache_ttl_seconds = cache_ttl_seconds
+        # Результаты проверок по имени: (время вычисления, отчет)
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._SessionLocal = sessionmaker(
+            autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine
+        )
+        # Кэш читают и пишут параллельные пробы /health из пула потоков
+        self._cache_lock = threading.Lock()
+        self.required_env_vars = _REQUIRED_ENV_VARS
 
     def check_environment_variables(self) -> Dict[str, Any]:
         """
@@ -47,21 +112,18 @@ class ApplicationHealthChecker:
         Returns:
             Dict[str, Any]: Результат проверки переменных окружения.
         """
-        missing_vars = []
-        empty_vars = []
-
-        for var in self.required_env_vars:
-            value = os.getenv(var)
-            if value is None:
-                missing_vars.append(var)
-            elif not value.strip():
-                empty_vars.append(var)
+        # Снимок значений: каждая переменная читается один раз за проверку
+        values = {var: os.environ.get(var) for var in self.required_env_vars}
+        missing_vars = [var for var, value in values.items() if value is None]
+        empty_vars = [
+            var for var, value in values.items() if value is not None and not value.strip()
+        ]
 
         result = {
             "status": "healthy",
             "message": "Все необходимые переменные окружения установлены",
             "details": {
-                "required_vars": self.required_env_vars,
+                "required_vars": list(self.required_env_vars),
                 "missing_vars": missing_vars,
                 "empty_vars": empty_vars,
             },
@@ -92,9 +154,7 @@ class ApplicationHealthChecker:
         try:
             with self.engine.connect() as connection:
                 # Выполняем простой запрос для проверки подключения
-                result = connection.execute(text("SELECT 1 as test"))
-                row = result.fetchone()
-                if row and row[0] == 1:
+                if connection.execute(text("SELECT 1")).scalar() == 1:
                     logger.info("Подключение к базе данных успешно")
                     return {
                         "status": "healthy",
@@ -116,24 +176,38 @@ class ApplicationHealthChecker:
                 "details": {"connection_test": "failed", "error": str(e)},
             }
 
-    def check_database_tables(self) -> Dict[str, Any]:
+    def _get_inspector(self) -> Inspector:
+        """
+        Возвращает новый Inspector для одной проверки.
+
+        Inspector кэширует результаты рефлексии без срока действия, поэтому
+        не переиспользуется между проверками: иначе удаленная или
+        переименованная позже таблица продолжала бы проходить проверку.
+        Параллельные проверки также не делят один Inspector между потоками.
+        """
+        return inspect(self.engine)
+
+    def check_database_tables(
+        self, include_extra_tables: bool = False
+    ) -> Dict[str, Any]:
         """
         Проверяет существование необходимых таблиц.
 
+        Каждая ожидаемая таблица проверяется через `has_table`; полный список
+        таблиц схемы запрашивается, только если какие-то таблицы отсутствуют
+        или запрошены лишние таблицы (иначе `extra_tables` пуст).
+
+        Args:
+            include_extra_tables: Вычислять ли список лишних таблиц.
+
         Returns:
             Dict[str, Any]: Результат проверки таблиц.
         """
         try:
-            inspector = inspect(self.engine)
-            existing_tables = inspector.get_table_names()
+            inspector = self._get_inspector()
 
             # Получаем список таблиц из моделей SQLAlchemy
-            # Some Base subclasses may not be direct ORM mapped classes; filter those with __tablename__
-            expected_tables = [
-                table.__tablename__
-                for table in Base.__subclasses__()
-                if hasattr(table, "__tablename__")
-            ]
+            expected_tables = list(_expected_tables())
 
             # Добавляем таблицы из других модулей, если они есть
             additional_tables: List[str] = []  # Например: ['alembic_version']
@@ -141,11 +215,15 @@ class ApplicationHealthChecker:
             all_expected = expected_tables + additional_tables
 
             missing_tables = [
-                table for table in all_expected if table not in existing_tables
-            ]
-            extra_tables = [
-                table for table in existing_tables if table not in all_expected
+                table for table in all_expected if not inspector.has_table(table)
             ]
+            if missing_tables or include_extra_tables:
+                existing_tables = inspector.get_table_names()
+                extra_tables = sorted(set(existing_tables) - set(all_expected))
+            else:
+                # Все ожидаемые таблицы на месте — полный список не нужен
+                existing_tables = all_expected
+                extra_tables = []
 
             result: Dict[str, Any] = {
                 "status": "healthy" if not missing_tables else "warning",
@@ -186,12 +264,9 @@ class ApplicationHealthChecker:
         """
         try:
             with self.engine.connect() as connection:
-                # Проверяем возможность создания временной таблицы
-                connection.execute(
-                    text("CREATE TEMP TABLE test_permissions (id SERIAL PRIMARY KEY)")
-                )
-                connection.execute(text("INSERT INTO test_permissions DEFAULT VALUES"))
-                connection.execute(text("DROP TABLE test_permissions"))
+                # Проверяем возможность создания временной таблицы;
+                # DO-блок выполняется на сервере за один запрос
+                connection.exec_driver_sql(_PERMISSIONS_CHECK_SQL)
                 connection.commit()
 
                 logger.info("Права доступа к базе данных в порядке")
@@ -209,37 +284,73 @@ class ApplicationHealthChecker:
                 "details": {"permissions_test": "failed", "error": str(e)},
             }
 
+    @staticmethod
+    def _find_superadmin_id(session: Session) -> Optional[int]:
+        """Возвращает id пользователя superadmin (только id, без загрузки ORM-объекта)."""
+        return session.scalar(
+            select(User.id)
+            .where(User.username == "superadmin", User.is_admin)
+            .limit(1)
+        )
+
+    def check_superadmin(self) -> Dict[str, Any]:
+        """
+        Проверяет наличие пользователя superadmin, ничего не изменяя в БД.
+
+        Используется проверками здоровья и пробами: они только читают.
+        Создает пользователя `check_and_create_superadmin` при запуске
+        приложения.
+
+        Returns:
+            Dict[str, Any]: Результат проверки superadmin пользователя.
+        """
+        try:
+            with self._SessionLocal() as session:
+                superadmin_id = self._find_superadmin_id(session)
+        except SQLAlchemyError as e:
+            logger.error(f"Ошибка при проверке пользователя superadmin: {str(e)}")
+            return {
+                "status": "unhealthy",
+                "message": f"Ошибка при проверке пользователя superadmin: {str(e)}",
+                "details": {"error": str(e)},
+            }
+
+        if superadmin_id is None:
+            return {
+                "status": "warning",
+                "message": "Пользователь superadmin не найден",
+                "details": {"superadmin_exists": False},
+            }
+        return {
+            "status": "healthy",
+            "message": "Пользователь superadmin существует",
+            "details": {"superadmin_exists": True, "user_id": superadmin_id},
+        }
+
     def check_and_create_superadmin(self) -> Dict[str, Any]:
         """
         Проверяет наличие пользователя superadmin и создает его при необходимости.
 
+        Пишет в БД, поэтому вызывается только при запуске приложения
+        (`ensure_application_ready`), а не из проверок здоровья.
+
         Returns:
             Dict[str, Any]: Результат проверки/создания superadmin пользователя.
         """
         try:
             # Используем контекстный менеджер для сессии
-            from sqlalchemy.orm import sessionmaker
-
-            SessionLocal = sessionmaker(
-                autocommit=False, autoflush=False, bind=self.engine
-            )
-
-            with SessionLocal() as session:
+            with self._SessionLocal() as session:
                 # Проверяем существование superadmin пользователя
-                superadmin = (
-                    session.query(User)
-                    .filter(User.username == "superadmin", User.is_admin)
-                    .first()
-                )
+                superadmin_id = self._find_superadmin_id(session)
 
-                if superadmin is not None:
+                if superadmin_id is not None:
                     logger.info("Пользователь superadmin уже существует")
                     return {
                         "status": "healthy",
                         "message": "Пользователь superadmin уже существует",
                         "details": {
                             "superadmin_exists": True,
-                            "user_id": superadmin.id,
+                            "user_id": superadmin_id,
                             "action_taken": "none",
                         },
                     }
@@ -254,7 +365,7 @@ class ApplicationHealthChecker:
 
                 session.add(new_superadmin)
                 session.commit()
-                session.refresh(new_superadmin)
+                # id уже получен из INSERT ... RETURNING, refresh не нужен
 
                 logger.info(
                     f"Пользователь superadmin успешно создан с ID: {new_superadmin.id}"
@@ -294,20 +405,20 @@ class ApplicationHealthChecker:
         issues = []
 
         # Проверяем APP_ENV
-        app_env = os.getenv("APP_ENV", "").lower()
-        if app_env not in ["development", "production", "testing"]:
+        app_env = (os.environ.get("APP_ENV") or "").lower()
+        if app_env not in _VALID_APP_ENVS:
             issues.append(
                 f"Некорректное значение APP_ENV: '{app_env}' (должно быть development/production/testing)"
             )
 
         # Проверяем SECRET_KEY
-        secret_key = os.getenv("SECRET_KEY", "")
+        secret_key = os.environ.get("SECRET_KEY") or ""
         if len(secret_key) < 32:
             issues.append("SECRET_KEY слишком короткий (минимум 32 символа)")
 
         # Проверяем DEBUG
-        debug = os.getenv("DEBUG", "").lower()
-        if debug not in ["true", "false"]:
+        debug = (os.environ.get("DEBUG") or "").lower()
+        if debug not in _VALID_DEBUG:
             issues.append(
                 f"Некорректное значение DEBUG: '{debug}' (должно быть true/false)"
             )
@@ -321,7 +432,7 @@ class ApplicationHealthChecker:
             ),
             "details": {
                 "issues": issues,
-                "settings_checked": ["APP_ENV", "SECRET_KEY", "DEBUG"],
+                "settings_checked": list(_SETTINGS_CHECKED),
             },
         }
 
@@ -342,18 +453,21 @@ class ApplicationHealthChecker:
         try:
             logger.info("Запуск миграций базы данных...")
 
-            # Получаем путь к корневой директории проекта
-            project_root = os.path.dirname(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            )
+            # Таймаут в процессе реализуется через SIGALRM, который доступен
+            # только на Unix и только в главном потоке
+            if (
+                hasattr(signal, "SIGALRM")
+                and threading.current_thread() is threading.main_thread()
+            ):
+                return self._run_migrations_in_process()
 
-            # Запускаем команду alembic upgrade head
+            # Запускаем команду alembic upgrade head в отдельном процессе
             result = subprocess.run(
                 [sys.executable, "-m", "alembic", "upgrade", "head"],
-                cwd=project_root,
+                cwd=_PROJECT_ROOT,
                 capture_output=True,
                 text=True,
-                timeout=300,  # 5 минут таймаут
+                timeout=MIGRATION_TIMEOUT_SECONDS,
             )
 
             if result.returncode == 0:
@@ -374,7 +488,7 @@ class ApplicationHealthChecker:
                     },
                 }
 
-        except subprocess.TimeoutExpired:
+        except (subprocess.TimeoutExpired, TimeoutError):
             logger.error("Таймаут выполнения миграций")
             return {
                 "status": "unhealthy",
@@ -389,6 +503,64 @@ class ApplicationHealthChecker:
                 "details": {"error": str(e)},
             }
 
+    def _run_migrations_in_process(self) -> Dict[str, Any]:
+        """
+        Выполняет `alembic upgrade head` в текущем процессе через API Alembic.
+
+        Не запускает новый интерпретатор и не импортирует приложение заново.
+        Вывод Alembic перехватывается из его логгера.
+
+        Returns:
+            Dict[str, Any]: Результат выполнения миграций.
+
+        Raises:
+            TimeoutError: Если миграции не уложились в таймаут.
+        """
+        from alembic import command
+        from alembic.config import Config
+
+        output = io.StringIO()
+        handler = logging.StreamHandler(output)
+        alembic_logger = logging.getLogger("alembic")
+        previous_level = alembic_logger.level
+        alembic_logger.addHandler(handler)
+        alembic_logger.setLevel(logging.INFO)
+
+        def _on_timeout(signum: int, frame: Any) -> None:
+            raise TimeoutError("migration timeout")
+
+        previous_handler = signal.signal(signal.SIGALRM, _on_timeout)
+        signal.alarm(MIGRATION_TIMEOUT_SECONDS)
+        try:
+            config = Config(_ALEMBIC_INI)
+            # Не перенастраивать логирование приложения из alembic.ini
+            config.attributes["configure_logger"] = False
+            command.upgrade(config, "head")
+        except TimeoutError:
+            raise
+        except Exception as e:
+            logger.error(f"Ошибка выполнения миграций: {str(e)}")
+            return {
+                "status": "unhealthy",
+                "message": f"Ошибка выполнения миграций: {str(e)}",
+                "details": {
+                    "migration_output": output.getvalue().strip(),
+                    "error_output": str(e),
+                },
+            }
+        finally:
+            signal.alarm(0)
+            signal.signal(signal.SIGALRM, previous_handler)
+            alembic_logger.removeHandler(handler)
+            alembic_logger.setLevel(previous_level)
+
+        logger.info("Миграции базы данных выполнены успешно")
+        return {
+            "status": "healthy",
+            "message": "Миграции базы данных выполнены успешно",
+            "details": {"migration_output": output.getvalue().strip()},
+        }
+
     def ensure_database_ready(self) -> Dict[str, Any]:
         """
         Гарантирует готовность базы данных, автоматически запуская миграции при необходимости.
@@ -429,9 +601,19 @@ class ApplicationHealthChecker:
 
             migration_result = self.run_database_migrations()
             if migration_result["status"] == "healthy":
-                # Проверяем таблицы еще раз после миграций
-                final_check = self.check_database_tables()
-                if final_check["status"] == "healthy":
+                # Проверяем только таблицы, которых не было до миграций
+                try:
+                    inspector = self._get_inspector()
+                    still_missing = [
+                        table
+                        for table in tables_check["details"]["missing_tables"]
+                        if not inspector.has_table(table)
+                    ]
+                except SQLAlchemyError as e:
+                    logger.error(f"Ошибка проверки таблиц после миграций: {str(e)}")
+                    still_missing = list(tables_check["details"]["missing_tables"])
+                final_check = {"missing_tables": still_missing}
+                if not still_missing:
                     return {
                         "status": "healthy",
                         "message": "База данных подготовлена успешно с помощью миграций",
@@ -467,49 +649,167 @@ class ApplicationHealthChecker:
             "details": tables_check,
         }
 
-    def perform_full_health_check(self) -> Dict[str, Any]:
+    def perform_full_health_check(self, force: bool = False) -> Dict[str, Any]:
         """
         Выполняет полную проверку здоровья приложения.
 
+        Результат кэшируется на `cache_ttl_seconds`, чтобы частые запросы
+        к /health не нагружали базу данных.
+
+        Args:
+            force: Выполнить проверку заново, игнорируя кэш.
+
         Returns:
             Dict[str, Any]: Полный отчет о состоянии приложения.
         """
-        logger.info("Начинаем полную проверку здоровья приложения")
+        return self._cached("full", self._perform_full_health_check, force=force)
 
-        results: Dict[str, Any] = {
-            "overall_status": "healthy",
-            "checks": {
-                "environment": self.check_environment_variables(),
-                "database_connection": self.check_database_connection(),
-                "database_tables": self.check_database_tables(),
-                "database_permissions": self.check_database_permissions(),
-                "superadmin_user": self.check_and_create_superadmin(),
-                "application_settings": self.check_application_settings(),
-            },
-        }
+    def _perform_full_health_check(self) -> Dict[str, Any]:
+        """Выполняет полную проверку без кэша."""
+        logger.info("Начинаем полную проверку здоровья приложения")
 
-        # Определяем общий статус
-        checks_dict = results["checks"]
-        if isinstance(checks_dict, dict):
-            for check_name, check_result in checks_dict.items():
-                if (
-                    isinstance(check_result, dict)
-                    and check_result.get("status") == "unhealthy"
-                ):
-                    results["overall_status"] = "unhealthy"
-                    break
-                elif (
-                    isinstance(check_result, dict)
-                    and check_result.get("status") == "warning"
-                    and results["overall_status"] == "healthy"
-                ):
-                    results["overall_status"] = "warning"
+        results = self._build_report(
+            self._run_checks(
+                {
+                    "environment": self.check_environment_variables,
+                    "database_connection": self.check_database_connection,
+                    "database_tables": self.check_database_tables,
+                    "database_permissions": self.check_database_permissions,
+                    "superadmin_user": self.check_superadmin,
+                    "application_settings": self.check_application_settings,
+                }
+            )
+        )
 
         logger.info(
             f"Проверка здоровья завершена. Общий статус: {results['overall_status']}"
         )
         return results
 
+    def perform_liveness_check(self) -> Dict[str, Any]:
+        """
+        Выполняет лёгкую проверку живости приложения.
+
+        Проверяет только переменные окружения и подключение к БД
+        (один запрос), поэтому подходит для частых liveness-проб.
+        Результат кэшируется на `cache_ttl_seconds`.
+
+        Returns:
+            Dict[str, Any]: Отчет о состоянии приложения.
+        """
+        return self._cached(
+            "liveness",
+            lambda: self._build_report(
+                {
+                    "environment": self.check_environment_variables(),
+                    "database_connection": self.check_database_connection(),
+                }
+            ),
+        )
+
+    def perform_readiness_check(self) -> Dict[str, Any]:
+        """
+        Выполняет проверку готовности приложения к обработке запросов.
+
+        В отличие от полной проверки не создает временных таблиц
+        (проверка прав доступа остается только в полной проверке).
+        Результат кэшируется на `cache_ttl_seconds`.
+
+        Returns:
+            Dict[str, Any]: Отчет о состоянии приложения.
+        """
+        return self._cached(
+            "readiness",
+            lambda: self._build_report(
+                self._run_checks(
+                    {
+                        "environment": self.check_environment_variables,
+                        "database_connection": self.check_database_connection,
+                        "database_tables": self.check_database_tables,
+                        "superadmin_user": self.check_superadmin,
+                        "application_settings": self.check_application_settings,
+                    }
+                )
+            ),
+        )
+
+    def _cached(
+        self, key: str, compute: Callable[[], Dict[str, Any]], force: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Возвращает результат проверки `key` из кэша или вычисляет его заново.
+
+        Частые пробы балансировщика в пределах `cache_ttl_seconds`
+        получают уже готовый отчет без запросов к БД.
+
+        Args:
+            key: Имя проверки в кэше.
+            compute: Функция, выполняющая проверку.
+            force: Выполнить проверку заново, игнорируя кэш.
+
+        Returns:
+            Dict[str, Any]: Отчет о состоянии приложения.
+        """
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if (
+            not force
+            and entry is not None
+            and time.monotonic() - entry[0] < self.cache_ttl_seconds
+        ):
+            return entry[1]
+        result = compute()
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), result)
+        return result
+
+    def _run_checks(
+        self, checks: Dict[str, Callable[[], Dict[str, Any]]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Выполняет независимые проверки параллельно в пуле потоков.
+
+        Проверки в основном ждут ответа БД, поэтому общее время равно
+        самой долгой проверке, а не их сумме. Каждая проверка берет свое
+        соединение из пула движка.
+
+        Args:
+            checks: Функции проверок по именам.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Результаты в исходном порядке имен.
+        """
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = {name: executor.submit(check) for name, check in checks.items()}
+            return {name: future.result() for name, future in futures.items()}
+
+    @staticmethod
+    def _build_report(checks: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Формирует отчет и определяет общий статус по результатам проверок.
+
+        Args:
+            checks: Результаты отдельных проверок по именам.
+
+        Returns:
+            Dict[str, Any]: Отчет с общим статусом и результатами проверок.
+        """
+        overall_status = "healthy"
+        for check_result in checks.values():
+            status = check_result.get("status")
+            if status == "unhealthy":
+                overall_status = "unhealthy"
+                break
+            elif status == "warning":
+                overall_status = "warning"
+
+        return {
+            "overall_status": overall_status,
+            # Время проверки: для кэшированного отчета — время его вычисления
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "checks": checks,
+        }
+
     def get_health_summary(self) -> str:
         """
         Возвращает краткую сводку состояния здоровья.
@@ -528,6 +828,17 @@ class ApplicationHealthChecker:
             return "❌ Приложение не готово к работе"
 
 
+@lru_cache(maxsize=1)
+def get_health_checker() -> ApplicationHealthChecker:
+    """
+    Возвращает общий экземпляр ApplicationHealthChecker (создаётся лениво).
+
+    Общий экземпляр позволяет переиспользовать кэш результатов
+    проверок между функциями модуля и эндпоинтами /health.
+    """
+    return ApplicationHealthChecker()
+
+
 def check_application_health() -> bool:
     """
     Быстрая функция для проверки здоровья приложения.
@@ -535,8 +846,7 @@ def check_application_health() -> bool:
     Returns:
         bool: True если приложение здорово, False в противном случае.
     """
-    checker = ApplicationHealthChecker()
-    result = checker.perform_full_health_check()
+    result = get_health_checker().perform_full_health_check()
     overall_status = str(result.get("overall_status", ""))
     return overall_status == "healthy"
 
@@ -550,7 +860,7 @@ def ensure_application_ready() -> None:
     """
     logger.info("Проверяем готовность приложения...")
 
-    checker = ApplicationHealthChecker()
+    checker = get_health_checker()
 
     # Сначала проверяем переменные окружения
     env_check = checker.check_environment_variables()
@@ -574,8 +884,18 @@ def ensure_application_ready() -> None:
             f"Приложение не готово к работе: {db_ready_result['message']}"
         )
 
-    # Финальная проверка здоровья
-    if not check_application_health():
+    # Создаем superadmin при запуске: проверки здоровья только читают БД
+    superadmin_result = checker.check_and_create_superadmin()
+    if superadmin_result["status"] != "healthy":
+        logger.error(f"Не удалось подготовить superadmin: {superadmin_result['message']}")
+        raise RuntimeError(
+            f"Приложение не готово к работе: {superadmin_result['message']}"
+        )
+
+    # Финальная проверка здоровья: принудительно, чтобы не взять результат
+    # из кэша, полученный до миграций; дальнейшие вызовы используют его кэш
+    result = checker.perform_full_health_check(force=True)
+    if result.get("overall_status") != "healthy":
         raise RuntimeError("Приложение не готово к работе после всех проверок.")
 
     logger.info("Приложение готово к работе")
@@ -584,13 +904,12 @@ def ensure_application_ready() -> None:
 def print_health_report() -> None:
     """
     Выводит подробный отчет о состоянии здоровья приложения.
-    """
-    checker = ApplicationHealthChecker()
-    result = checker.perform_full_health_check()
 
-    print("\n" + "=" * 60)
-    print("ОТЧЕТ О ЗДОРОВЬЕ ПРИЛОЖЕНИЯ")
-    print("=" * 60)
+    Отчёт собирается целиком и выводится одной записью в stdout.
+    """
+    result = get_health_checker().perform_full_health_check()
+    separator = "=" * 60
+    lines: List[str] = ["", separator, "ОТЧЕТ О ЗДОРОВЬЕ ПРИЛОЖЕНИЯ", separator]
 
     status_emoji = {"healthy": "✅", "warning": "⚠️ ", "unhealthy": "❌"}
 
@@ -599,27 +918,34 @@ def print_health_report() -> None:
         for check_name, check_result in checks_dict.items():
             if isinstance(check_result, dict):
                 emoji = status_emoji.get(check_result.get("status", ""), "❓")
-                print(f"\n{emoji} {check_name.upper()}:")
-                print(f"   Статус: {check_result.get('status', 'unknown')}")
-                print(f"   Сообщение: {check_result.get('message', 'no message')}")
+                lines.append("")
+                lines.append(f"{emoji} {check_name.upper()}:")
+                lines.append(f"   Статус: {check_result.get('status', 'unknown')}")
+                lines.append(
+                    f"   Сообщение: {check_result.get('message', 'no message')}"
+                )
 
                 details = check_result.get("details")
                 if isinstance(details, dict):
                     if "missing_vars" in details and details["missing_vars"]:
-                        print(
+                        lines.append(
                             f"   Отсутствующие переменные: {', '.join(details['missing_vars'])}"
                         )
                     if "empty_vars" in details and details["empty_vars"]:
-                        print(
+                        lines.append(
                             f"   Пустые переменные: {', '.join(details['empty_vars'])}"
                         )
                     if "issues" in details and details["issues"]:
-                        for issue in details["issues"]:
-                            print(f"   • {issue}")
+                        lines.extend(f"   • {issue}" for issue in details["issues"])
 
     overall_status = str(result.get("overall_status", "unknown"))
-    print("\n" + "=" * 60)
-    print(
+    lines.append("")
+    lines.append(separator)
+    lines.append(
         f"ОБЩИЙ СТАТУС: {status_emoji.get(overall_status, '❓')} {overall_status.upper()}"
     )
-    print("=" * 60 + "\n")
+    lines.append(separator)
+    lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
@@ -5,17 +5,52 @@
 транскрибации, переводов и суммаризации с использованием AI моделей.
 """
 
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-from src.database import Base, engine, ensure_application_ready
+from src.database import (
+    Base,
+    enable_lazy_load_warnings,
+    ensure_application_ready,
+    get_engine,
+)
+from src.database.database import DB_POOL_MAX_CONNECTIONS
 from src.routers import api_router
 
 # Проверка готовности приложения перед запуском
 ensure_application_ready()
 
-# Создание всех таблиц в базе данных на основе моделей
-Base.metadata.create_all(bind=engine)
+# Схемой управляют миграции Alembic (их запускает ensure_application_ready).
+# Создание таблиц по моделям оставлено только для тестового окружения.
+if os.getenv("APP_ENV") == "testing":
+    Base.metadata.create_all(bind=get_engine())
+
+# В разработке каждая ленивая загрузка связи (возможный N+1) пишется в лог
+if os.getenv("APP_ENV") == "development":
+    enable_lazy_load_warnings()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Настройка приложения при запуске.
+
+    Синхронные (`def`) эндпоинты FastAPI выполняет в пуле потоков AnyIO,
+    ограниченном по умолчанию 40 потоками. Лимит выравнивается по размеру
+    синхронного пула соединений БД (DB_POOL_SIZE + DB_POOL_OVERFLOW):
+    каждый поток держит не больше одного соединения, поэтому лишние потоки
+    только ждали бы соединения, а запросы не ждут свободного потока, пока
+    в пуле есть соединения.
+    """
+    to_thread.current_default_thread_limiter().total_tokens = DB_POOL_MAX_CONNECTIONS
+    yield
+
 
 # Инициализация FastAPI приложения
 app = FastAPI(
@@ -24,6 +59,9 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    # JSON ответов сериализуется orjson (C) вместо стандартного json
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Настройка CORS
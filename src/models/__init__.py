@@ -5,11 +5,26 @@
 включая пользователей, AI модели, аудиофайлы и связанные сущности.
 """
 
+from sqlalchemy.orm import configure_mappers
+
 from src.models.users import User as User
 from src.models.ai_models import AIModel as AIModel
 from src.models.audio_files import AudioFile as AudioFile
 from src.models.transcriptions import Transcription as Transcription
 from src.models.translations import Translation as Translation
 from src.models.summaries import Summary as Summary
+from src.models.transcription_segments import TranscriptionSegments as TranscriptionSegments
+
+# Все модели импортированы: настраиваем связи сразу при импорте пакета,
+# а не при первом запросе (ошибки конфигурации тоже видны при старте)
+configure_mappers()
 
-__all__ = ["User", "AIModel", "AudioFile", "Transcription", "Translation", "Summary"]
+__all__ = [
+    "User",
+    "AIModel",
+    "AudioFile",
+    "Transcription",
+    "Translation",
+    "Summary",
+    "TranscriptionSegments",
+]
@@ -49,21 +49,24 @@ class AIModel(Base):
     operation: Mapped[Operation] = mapped_column(SAEnum(Operation, name="operation", native_enum=True, create_type=False))
 
     # Relationships
+    # Дочерние строки удаляет PostgreSQL (ON DELETE CASCADE): ORM не загружает
+    # и не удаляет их по одной, а passive_deletes="all" не даёт обнулять
+    # ai_model_id у уже загруженных объектов
     transcriptions: Mapped[list["Transcription"]] = relationship(
         "Transcription",
         back_populates="ai_model",
-        cascade="all, delete-orphan",
-        passive_deletes=True,
+        cascade="save-update, merge",
+        passive_deletes="all",
     )
     translations: Mapped[list["Translation"]] = relationship(
         "Translation",
         back_populates="ai_model",
-        cascade="all, delete-orphan",
-        passive_deletes=True,
+        cascade="save-update, merge",
+        passive_deletes="all",
     )
     summaries: Mapped[list["Summary"]] = relationship(
         "Summary",
         back_populates="ai_model",
-        cascade="all, delete-orphan",
-        passive_deletes=True,
+        cascade="save-update, merge",
+        passive_deletes="all",
     )
@@ -7,7 +7,7 @@
 from __future__ import annotations
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import Integer, String, Float, DateTime, ForeignKey
+from sqlalchemy import Integer, String, Float, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.database import Base
@@ -36,23 +36,33 @@ class AudioFile(Base):
         transcriptions: Связанные транскрибации (удаляются каскадно при удалении файла).
     """
     __tablename__ = "audio_files"
+    # Фильтр по пользователю + ORDER BY id (keyset-пагинация списка);
+    # ведущий user_id также обслуживает ON DELETE SET NULL при удалении
+    # пользователя, поэтому отдельный индекс по user_id не нужен
+    __table_args__ = (
+        Index("ix_audio_files_user_id_id", "user_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     # При удалении пользователя user_id устанавливается в NULL (каскадное правило SET NULL)
-    user_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey('users.id', ondelete="SET NULL"), index=True, nullable=True)
+    user_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey('users.id', ondelete="SET NULL"), nullable=True)
     filename: Mapped[str] = mapped_column(String)
     original_filename: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     filepath: Mapped[str] = mapped_column(String)
     format: Mapped[str] = mapped_column(String)
     file_size: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # in bytes
     duration: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # in seconds
-    add_time: Mapped[DateTime] = mapped_column(DateTime, default=func.now())
+    add_time: Mapped[DateTime] = mapped_column(DateTime, server_default=func.now())
     # Use shared SQLAlchemy ENUM type from src.models.enums
     status: Mapped[Status] = mapped_column(StatusType)
     error_text: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
     # Relationships
-    user: Mapped["User"] = relationship("User", back_populates="audio_files")
+    # lazy="raise_on_sql": неявная загрузка владельца (N+1) вызывает ошибку,
+    # загружать явно через selectinload/joinedload
+    user: Mapped["User"] = relationship(
+        "User", back_populates="audio_files", lazy="raise_on_sql"
+    )
     transcriptions: Mapped[list["Transcription"]] = relationship(
         "Transcription",
         back_populates="audio_file",
@@ -21,9 +21,23 @@ class ProcessingStatus(PyEnum):
     COMPLETED = "completed"
     FAILED = "failed"
 
+# Члены Status по строковому значению: поиск в словаре вместо
+# вызова Status(value) при разборе входных данных каждого запроса
+STATUS_BY_VALUE = {member.value: member for member in Status}
+
 # SQLAlchemy типы для PostgreSQL native ENUM
-# create_type=False предотвращает повторное создание типа
+# create_type=False предотвращает повторное создание типа.
+# В БД хранятся имена членов (UPLOADED, PENDING, ...), а не значения, поэтому
+# values_callable здесь не задаётся: он изменил бы метки типа и потребовал бы
+# миграции данных. Преобразование метки в член перечисления при чтении —
+# поиск в словаре; там, где нужна только строка, используйте `.value`.
 StatusType = SAEnum(Status, name="status", native_enum=True, create_type=False)
 ProcessingStatusType = SAEnum(ProcessingStatus, name="processing_status", native_enum=True, create_type=False)
 
-__all__ = ["Status", "StatusType", "ProcessingStatus", "ProcessingStatusType"]
+__all__ = [
+    "Status",
+    "StatusType",
+    "ProcessingStatus",
+    "ProcessingStatusType",
+    "STATUS_BY_VALUE",
+]
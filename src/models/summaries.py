@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import Integer, String, Float, ForeignKey, DateTime, JSON
+from sqlalchemy import Integer, String, Float, ForeignKey, DateTime, JSON, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.database import Base
@@ -25,7 +25,7 @@ class Summary(Base):
     Attributes:
         id: Уникальный идентификатор суммаризации.
         translation_id: ID перевода (удаляется каскадно при удалении перевода).
-        ai_model_id: ID AI модели.
+        ai_model_id: ID AI модели (удаляется каскадно при удалении модели).
         text_summary_en: Текст суммаризации на английском.
         text_summary_ru: Текст суммаризации на русском.
         start_time: Время начала сегмента.
@@ -36,13 +36,17 @@ class Summary(Base):
         ai_model: Связанная AI модель.
     """
     __tablename__ = "summaries"
+    __table_args__ = (
+        # Фильтр списка + ORDER BY id (keyset-пагинация)
+        Index("ix_summaries_status_id", "status", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     # При удалении перевода суммаризация удаляется каскадно
     translation_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey('translations.id', ondelete="CASCADE"), index=True, nullable=True)
     # optional link to transcription if summary was created directly from transcription
     transcription_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey('transcriptions.id', ondelete="SET NULL"), index=True, nullable=True)
-    ai_model_id: Mapped[int] = mapped_column(Integer, ForeignKey('ai_models.id'), index=True)
+    ai_model_id: Mapped[int] = mapped_column(Integer, ForeignKey('ai_models.id', ondelete="CASCADE"), index=True)
     text_summary_en: Mapped[str] = mapped_column(String)
     text_summary_ru: Mapped[str] = mapped_column(String)
     start_time: Mapped[float] = mapped_column(Float)  # in seconds
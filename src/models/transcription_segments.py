@@ -0,0 +1,33 @@
+"""
+Модель колоночного представления сегментов транскрибации.
+
+Хранит границы и тексты всех сегментов аудиофайла массивами в одной строке,
+чтобы таймлайн читался одним запросом без разбора строки на каждый сегмент.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Float, ForeignKey, Integer, String
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+from src.database import Base
+
+class TranscriptionSegments(Base):
+    """
+    Сегменты транскрибации аудиофайла в виде массивов (кэш по transcriptions).
+
+    Элементы с одинаковым индексом во всех массивах относятся к одному
+    сегменту; порядок — по id транскрибации.
+
+    Attributes:
+        audio_file_id: ID аудиофайла (удаляется каскадно при удалении файла).
+        start_times: Время начала сегментов в секундах.
+        end_times: Время окончания сегментов в секундах.
+        texts: Тексты сегментов.
+    """
+    __tablename__ = "transcription_segments"
+
+    audio_file_id: Mapped[int] = mapped_column(Integer, ForeignKey('audio_files.id', ondelete="CASCADE"), primary_key=True)
+    start_times: Mapped[list[float]] = mapped_column(ARRAY(Float))
+    end_times: Mapped[list[float]] = mapped_column(ARRAY(Float))
+    texts: Mapped[list[str]] = mapped_column(ARRAY(String))
@@ -8,9 +8,9 @@ from __future__ import annotations
 
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import Integer, String, Float, ForeignKey, DateTime
+from sqlalchemy import Integer, String, Float, ForeignKey, DateTime, Index
 from sqlalchemy.sql import func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, synonym
 from src.database import Base
 from src.models.enums import ProcessingStatus, ProcessingStatusType
 
@@ -26,7 +26,7 @@ class Transcription(Base):
     Attributes:
         id: Уникальный идентификатор транскрибации.
         audio_file_id: ID аудиофайла (удаляется каскадно при удалении файла).
-        ai_model_id: ID AI модели.
+        ai_model_id: ID AI модели (удаляется каскадно при удалении модели).
         language: Язык транскрибации.
         text_transcription: Текст транскрибации.
         start_time: Время начала сегмента.
@@ -38,11 +38,17 @@ class Transcription(Base):
         translations: Связанные переводы (удаляются каскадно при удалении транскрибации).
     """
     __tablename__ = "transcriptions"
+    # Фильтр списка + ORDER BY id (keyset-пагинация); ведущий audio_file_id
+    # также обслуживает каскадное удаление вместе с аудиофайлом
+    __table_args__ = (
+        Index("ix_transcriptions_status_id", "status", "id"),
+        Index("ix_transcriptions_audio_file_id_id", "audio_file_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     # При удалении аудиофайла транскрибация удаляется каскадно
-    audio_file_id: Mapped[int] = mapped_column(Integer, ForeignKey('audio_files.id', ondelete="CASCADE"), index=True)
-    ai_model_id: Mapped[int] = mapped_column(Integer, ForeignKey('ai_models.id'), index=True)
+    audio_file_id: Mapped[int] = mapped_column(Integer, ForeignKey('audio_files.id', ondelete="CASCADE"))
+    ai_model_id: Mapped[int] = mapped_column(Integer, ForeignKey('ai_models.id', ondelete="CASCADE"), index=True)
     language: Mapped[str] = mapped_column(String)
     text_transcription: Mapped[str] = mapped_column(String)
     start_time: Mapped[float] = mapped_column(Float)  # in seconds
@@ -64,11 +70,5 @@ class Transcription(Base):
         passive_deletes=True,
     )
 
-    # Compatibility property: allow router code to use .text
-    @property
-    def text(self) -> str:
-        return self.text_transcription
-
-    @text.setter
-    def text(self, value: str) -> None:
-        self.text_transcription = value
+    # Compatibility alias: allow router code to use .text (also usable in queries)
+    text: Mapped[str] = synonym("text_transcription")
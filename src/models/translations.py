@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import Integer, String, Float, ForeignKey, DateTime
+from sqlalchemy import Integer, String, Float, ForeignKey, DateTime, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.database import Base
@@ -26,7 +26,7 @@ class Translation(Base):
     Attributes:
         id: Уникальный идентификатор перевода.
         transcription_id: ID транскрибации (удаляется каскадно при удалении транскрибации).
-        ai_model_id: ID AI модели.
+        ai_model_id: ID AI модели (удаляется каскадно при удалении модели).
         text_translation_en: Текст перевода на английский.
         text_translation_ru: Текст перевода на русский.
         start_time: Время начала сегмента.
@@ -38,11 +38,19 @@ class Translation(Base):
         summaries: Связанные суммаризации (удаляются каскадно при удалении перевода).
     """
     __tablename__ = "translations"
+    __table_args__ = (
+        # Фильтр списка по статусу и GROUP BY status в статистике
+        Index("ix_translations_status_id", "status", "id"),
+        # Фильтр списка по транскрибации и статусу одновременно; ведущий
+        # transcription_id обслуживает и фильтр только по транскрибации,
+        # и каскадное удаление, поэтому отдельный индекс не нужен
+        Index("ix_translations_transcription_status", "transcription_id", "status"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     # При удалении транскрибации перевод удаляется каскадно
-    transcription_id: Mapped[int] = mapped_column(Integer, ForeignKey('transcriptions.id', ondelete="CASCADE"), index=True)
-    ai_model_id: Mapped[int] = mapped_column(Integer, ForeignKey('ai_models.id'), index=True)
+    transcription_id: Mapped[int] = mapped_column(Integer, ForeignKey('transcriptions.id', ondelete="CASCADE"))
+    ai_model_id: Mapped[int] = mapped_column(Integer, ForeignKey('ai_models.id', ondelete="CASCADE"), index=True)
     text_translation_en: Mapped[str] = mapped_column(String)
     text_translation_ru: Mapped[str] = mapped_column(String)
     start_time: Mapped[float] = mapped_column(Float)  # in seconds
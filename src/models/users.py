@@ -12,6 +12,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 
 from src.database import Base
+from src.utils.security import hash_password, verify_password
 
 if TYPE_CHECKING:
     from src.models.audio_files import AudioFile
@@ -39,8 +40,10 @@ class User(Base):
 
     # Relationships
     # DB uses ON DELETE SET NULL for audio_files.user_id, let DB handle deletes
+    # lazy="raise_on_sql": неявная загрузка связи (N+1) вызывает ошибку,
+    # загружать явно через selectinload/joinedload
     audio_files: Mapped[list["AudioFile"]] = relationship(
-        "AudioFile", back_populates="user", passive_deletes=True
+        "AudioFile", back_populates="user", passive_deletes=True, lazy="raise_on_sql"
     )
 
     def set_password(self, password: str) -> None:
@@ -50,8 +53,6 @@ class User(Base):
         Args:
             password: Пароль в открытом виде.
         """
-        from src.utils.security import hash_password
-
         self.password_hash = hash_password(password)
 
     def verify_password(self, password: str) -> bool:
@@ -64,6 +65,4 @@ class User(Base):
         Returns:
             bool: True если пароль верный.
         """
-        from src.utils.security import verify_password
-
         return verify_password(password, self.password_hash)
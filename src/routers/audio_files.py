@@ -7,15 +7,19 @@
 from datetime import datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
-from sqlalchemy.orm import Session
-
-from src.database import get_db
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only, raiseload
+
+from src.database import get_async_db, get_db, is_foreign_key_violation
 from src.models.audio_files import AudioFile
-from src.models.users import User
+from src.models.enums import Status
 from src.services.audio_service import AudioService
 from src.utils.fs import safe_remove
+from src.utils.pagination import paginate, set_next_cursor
 
 # Создаем роутер для audio files эндпоинтов
 router = APIRouter()
@@ -26,21 +30,22 @@ class AudioFileBase(BaseModel):
     """Базовая модель аудиофайла для API."""
 
     filename: str
-    original_filename: str
-    file_size: int
+    original_filename: Optional[str] = None
+    file_size: Optional[int] = None
     duration: Optional[float] = None
-    status: str = "uploaded"
+    status: Status = Status.UPLOADED
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class AudioFileResponse(AudioFileBase):
     """Модель ответа с аудиофайлом."""
 
     id: int
-    user_id: int
-    upload_date: datetime
+    # NULL после удаления владельца (ON DELETE SET NULL)
+    user_id: Optional[int] = None
+    # Время добавления хранится в столбце add_time
+    upload_date: datetime = Field(validation_alias="add_time")
 
 
 class AudioFileCreate(BaseModel):
@@ -48,44 +53,87 @@ class AudioFileCreate(BaseModel):
 
     filename: str
     original_filename: str
+    # Обязательные (NOT NULL) столбцы audio_files
+    filepath: str
+    format: str
     file_size: int
     duration: Optional[float] = None
     status: str = "uploaded"
 
 
-@router.get("/", response_model=List[AudioFileResponse])
+# Валидатор списка строится один раз; список проверяется за один вызов
+# вместо построения моделей по одной
+_AUDIO_FILE_LIST_ADAPTER = TypeAdapter(List[AudioFileResponse])
+
+
+# response_model=None: результат уже проверен адаптером, FastAPI не
+# валидирует его повторно; схема для документации задана через responses
+@router.get(
+    "/",
+    response_model=None,
+    responses={200: {"model": List[AudioFileResponse]}},
+)
 async def get_audio_files(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     user_id: Optional[int] = None,
-    db: Session = Depends(get_db),
-) -> List[AudioFile]:
+    db: AsyncSession = Depends(get_async_db),
+) -> List[AudioFileResponse]:
     """
     Получение списка аудиофайлов.
 
+    Запрос выполняется асинхронно (asyncpg) и не занимает поток из пула.
+
     Args:
-        skip: Количество файлов для пропуска (пагинация).
+        response: Ответ (заголовок X-Next-Cursor со следующим курсором).
+        skip: Количество файлов для пропуска (если курсор не задан).
         limit: Максимальное количество файлов для возврата.
+        cursor: Курсор следующей страницы (keyset-пагинация).
         user_id: Фильтр по ID пользователя.
         db: Сессия базы данных.
 
     Returns:
-        List[AudioFile]: Список аудиофайлов.
+        List[AudioFileResponse]: Список аудиофайлов.
     """
-    query = db.query(AudioFile)
+    # AudioFileResponse содержит только колонки AudioFile: связи не нужны,
+    # а raiseload("*") не даст сериализации незаметно выполнить N+1 запросов.
+    # Выбираем только столбцы, которые попадают в ответ (add_time
+    # отдается как upload_date)
+    stmt = select(AudioFile).options(
+        load_only(
+            AudioFile.id,
+            AudioFile.user_id,
+            AudioFile.filename,
+            AudioFile.original_filename,
+            AudioFile.file_size,
+            AudioFile.duration,
+            AudioFile.status,
+            AudioFile.add_time,
+        ),
+        raiseload("*"),
+    )
 
     if user_id:
-        query = query.filter(AudioFile.user_id == user_id)
+        stmt = stmt.where(AudioFile.user_id == user_id)
 
-    audio_files = query.offset(skip).limit(limit).all()
-    return audio_files
+    audio_files = (
+        await db.scalars(paginate(stmt, AudioFile.id, cursor, skip, limit))
+    ).all()
+    set_next_cursor(response, audio_files, limit)
+    return _AUDIO_FILE_LIST_ADAPTER.validate_python(audio_files, from_attributes=True)
 
 
 @router.get("/{file_id}", response_model=AudioFileResponse)
-async def get_audio_file(file_id: int, db: Session = Depends(get_db)) -> AudioFile:
+async def get_audio_file(
+    file_id: int, db: AsyncSession = Depends(get_async_db)
+) -> AudioFile:
     """
     Получение аудиофайла по ID.
 
+    Запрос выполняется асинхронно (asyncpg) и не занимает поток из пула.
+
     Args:
         file_id: ID аудиофайла.
         db: Сессия базы данных.
@@ -96,15 +144,19 @@ async def get_audio_file(file_id: int, db: Session = Depends(get_db)) -> AudioFi
     Raises:
         HTTPException: Если файл не найден.
     """
-    audio_file = db.query(AudioFile).filter(AudioFile.id == file_id).first()
+    audio_file = await db.get(AudioFile, file_id, options=[raiseload("*")])
     if audio_file is None:
         raise HTTPException(status_code=404, detail="Аудиофайл не найден")
     return audio_file
 
 
 @router.post("/", response_model=AudioFileResponse)
-async def create_audio_file(
-    file_data: AudioFileCreate, user_id: int, db: Session = Depends(get_db)
+def create_audio_file(
+    file_data: AudioFileCreate,
+    user_id: int,
+    transcription_language: Optional[str] = None,
+    transcription_ai_model_id: Optional[int] = None,
+    db: Session = Depends(get_db),
 ) -> AudioFile:
     """
     Создание записи об аудиофайле.
@@ -112,38 +164,95 @@ async def create_audio_file(
     Args:
         file_data: Данные аудиофайла.
         user_id: ID пользователя-владельца.
+        transcription_language: Если задан, сразу создается ожидающая
+            транскрибация на этом языке (в той же транзакции).
+        transcription_ai_model_id: ID AI модели транскрибации (обязателен
+            вместе с `transcription_language`).
         db: Сессия базы данных.
 
     Returns:
         AudioFile: Созданная запись аудиофайла.
 
     Raises:
-        HTTPException: Если пользователь не найден.
+        HTTPException: Если пользователь или AI модель не найдены, не
+            указана AI модель транскрибации или данные нарушают
+            ограничения таблицы.
     """
-    # Проверяем существование пользователя
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
-        raise HTTPException(status_code=404, detail="Пользователь не найден")
-
-    created = AudioService.create_audio_record(
-        db,
-        filename=file_data.filename,
-        original_filename=file_data.original_filename,
-        file_size=file_data.file_size,
-        duration=file_data.duration,
-        user_id=user_id,
-        status=file_data.status,
-    )
+    if transcription_language is not None and transcription_ai_model_id is None:
+        raise HTTPException(
+            status_code=422,
+            detail="Для транскрибации нужно указать transcription_ai_model_id",
+        )
+    # Существование пользователя и AI модели проверяют внешние ключи при INSERT
+    try:
+        created = AudioService.create_audio_record(
+            db,
+            filename=file_data.filename,
+            original_filename=file_data.original_filename,
+            filepath=file_data.filepath,
+            format=file_data.format,
+            file_size=file_data.file_size,
+            duration=file_data.duration,
+            user_id=user_id,
+            status=file_data.status,
+            transcription_language=transcription_language,
+            transcription_ai_model_id=transcription_ai_model_id,
+        )
+    except IntegrityError as e:
+        db.rollback()
+        if is_foreign_key_violation(e):
+            raise HTTPException(
+                status_code=404, detail="Пользователь или AI модель не найдены"
+            )
+        raise HTTPException(status_code=422, detail="Некорректные данные аудиофайла")
     return created
 
 
+@router.post("/bulk")
+def create_audio_files_bulk(
+    files_data: List[AudioFileCreate], user_id: int, db: Session = Depends(get_db)
+) -> dict:
+    """
+    Массовое создание записей об аудиофайлах.
+
+    Args:
+        files_data: Данные аудиофайлов.
+        user_id: ID пользователя-владельца.
+        db: Сессия базы данных.
+
+    Returns:
+        dict: Количество и ID созданных записей.
+
+    Raises:
+        HTTPException: Если пользователь не найден или данные нарушают
+            ограничения таблицы.
+    """
+    # Существование пользователя проверяет внешний ключ при INSERT
+    try:
+        ids = AudioService.bulk_create_audio_records(
+            db, [file_data.model_dump() for file_data in files_data], user_id=user_id
+        )
+    except IntegrityError as e:
+        db.rollback()
+        if is_foreign_key_violation(e):
+            raise HTTPException(status_code=404, detail="Пользователь не найден")
+        raise HTTPException(status_code=422, detail="Некорректные данные аудиофайла")
+    return {"created": len(ids), "ids": ids}
+
+
 @router.delete("/{file_id}")
-async def delete_audio_file(file_id: int, db: Session = Depends(get_db)) -> dict:
+def delete_audio_file(
+    file_id: int, background_tasks: BackgroundTasks, db: Session = Depends(get_db)
+) -> dict:
     """
     Удаление аудиофайла.
 
+    Запись удаляется сразу, а файл с диска — фоновой задачей после
+    отправки ответа, чтобы ответ не ждал файловой системы.
+
     Args:
         file_id: ID аудиофайла для удаления.
+        background_tasks: Фоновые задачи FastAPI.
         db: Сессия базы данных.
 
     Returns:
@@ -152,22 +261,19 @@ async def delete_audio_file(file_id: int, db: Session = Depends(get_db)) -> dict
     Raises:
         HTTPException: Если файл не найден.
     """
-    audio_file = db.query(AudioFile).filter(AudioFile.id == file_id).first()
-    if audio_file is None:
-        raise HTTPException(status_code=404, detail="Аудиофайл не найден")
-
-    # Удаляем файл с диска безопасно и удаляем запись
+    # Путь к файлу на диске (filepath) возвращает сам DELETE
     try:
-        safe_remove(audio_file.filename)
-    except Exception:
-        # не прерываем удаление записи, логирование можно добавить
-        pass
-    AudioService.delete_audio_record(db, file_id=file_id)
+        filepath = AudioService.delete_audio_record(db, file_id=file_id)
+    except LookupError:
+        raise HTTPException(status_code=404, detail="Аудиофайл не найден")
+    # safe_remove не выбрасывает исключений, ошибка удаления файла
+    # не влияет на уже удалённую запись
+    background_tasks.add_task(safe_remove, filepath)
     return {"message": "Аудиофайл успешно удален"}
 
 
 @router.get("/stats/summary")
-async def get_audio_stats(db: Session = Depends(get_db)) -> dict:
+def get_audio_stats(db: Session = Depends(get_db)) -> dict:
     """
     Получение статистики по аудиофайлам.
 
@@ -4,9 +4,14 @@
 Этот модуль содержит эндпоинты для входа в систему и проверки токенов.
 """
 
+import hashlib
+import hmac
 import os
-from datetime import datetime, timedelta
-from typing import Dict
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Dict, Optional, Tuple
 
 import jwt
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -16,6 +21,9 @@ from sqlalchemy.orm import Session
 
 from src.database import get_db
 from src.models.users import User
+from src.schemas.base import OrmModel
+from src.services.user_service import UserService
+from src.utils.security import password_needs_rehash, verify_or_dummy
 
 # Создаем роутер для auth эндпоинтов
 router = APIRouter()
@@ -27,6 +35,19 @@ security = HTTPBasic()
 SECRET_KEY = os.getenv("SECRET_KEY", "supersecretkey12345678901234567890123456789012")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+# Время жизни токена по умолчанию (если expires_delta не передан)
+_DEFAULT_TOKEN_TTL_SECONDS = 15 * 60
+
+# Ключ в байтах для HMAC ключа кэша учетных данных, кодируется один раз
+_SECRET_KEY_BYTES = SECRET_KEY.encode()
+
+# Кэш успешных проверок учетных данных: позволяет не выполнять KDF
+# при повторных запросах с теми же данными в течение нескольких секунд
+AUTH_CACHE_TTL_SECONDS = 10.0
+AUTH_CACHE_MAXSIZE = 10000
+# (username, HMAC пароля) -> (момент истечения, id пользователя, хэш пароля)
+_auth_cache: "OrderedDict[Tuple[str, bytes], Tuple[float, int, str]]" = OrderedDict()
+_auth_cache_lock = threading.Lock()
 
 
 # Pydantic модели для API
@@ -43,16 +64,13 @@ class TokenData(BaseModel):
     username: str | None = None
 
 
-class UserResponse(BaseModel):
+class UserResponse(OrmModel):
     """Модель ответа с информацией о пользователе."""
 
     username: str
     is_admin: bool
     id: int
 
-    class Config:
-        from_attributes = True
-
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """
@@ -65,20 +83,56 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     Returns:
         str: JWT токен.
     """
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    ttl_seconds = (
+        int(expires_delta.total_seconds()) if expires_delta else _DEFAULT_TOKEN_TTL_SECONDS
+    )
+    # exp — целое число секунд (NumericDate), без создания datetime
+    return jwt.encode(
+        {**data, "exp": int(time.time()) + ttl_seconds}, SECRET_KEY, algorithm=ALGORITHM
+    )
+
+
+def _credentials_key(username: str, password: str) -> Tuple[str, bytes]:
+    """Ключ кэша: пароль не хранится даже в виде простого хэша."""
+    digest = hmac.new(_SECRET_KEY_BYTES, password.encode(), hashlib.sha256).digest()
+    return username, digest
+
+
+def _auth_cache_get(key: Tuple[str, bytes]) -> Optional[Tuple[int, str]]:
+    """Возвращает (id, хэш пароля) из кэша, если запись не устарела."""
+    with _auth_cache_lock:
+        entry = _auth_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, user_id, password_hash = entry
+        if expires_at < time.monotonic():
+            del _auth_cache[key]
+            return None
+        return user_id, password_hash
+
+
+def _auth_cache_put(key: Tuple[str, bytes], user_id: int, password_hash: str) -> None:
+    """Запоминает успешную проверку, вытесняя самые старые записи."""
+    with _auth_cache_lock:
+        _auth_cache[key] = (
+            time.monotonic() + AUTH_CACHE_TTL_SECONDS,
+            user_id,
+            password_hash,
+        )
+        _auth_cache.move_to_end(key)
+        while len(_auth_cache) > AUTH_CACHE_MAXSIZE:
+            _auth_cache.popitem(last=False)
 
 
 def authenticate_user(db: Session, username: str, password: str) -> User | None:
     """
     Аутентифицирует пользователя.
 
+    Успешные проверки кэшируются на AUTH_CACHE_TTL_SECONDS: при попадании
+    пользователь читается по первичному ключу (один индексный запрос) без
+    хеширования пароля. Поэтому удаление пользователя, смена имени или
+    пароля и права администратора учитываются сразу во всех процессах.
+
     Args:
         db: Сессия базы данных.
         username: Имя пользователя.
@@ -87,11 +141,30 @@ def authenticate_user(db: Session, username: str, password: str) -> User | None:
     Returns:
         User | None: Пользователь если аутентификация успешна, иначе None.
     """
-    user = db.query(User).filter(User.username == username).first()
-    if not user:
+    key = _credentials_key(username, password)
+    cached = _auth_cache_get(key)
+    if cached is not None:
+        user_id, password_hash = cached
+        user = db.get(User, user_id)
+        if (
+            user is not None
+            and user.username == username
+            and user.password_hash == password_hash
+        ):
+            return user
+
+    user = UserService.get_by_username(db, username)
+    if user is None:
+        # KDF по фиктивному хэшу: время ответа не выдает наличие имени
+        verify_or_dummy(password, None)
         return None
-    if not user.verify_password(password):
+    if not verify_or_dummy(password, user.password_hash):
         return None
+    if password_needs_rehash(user.password_hash):
+        # Старый bcrypt или прежние параметры Argon2id: пересчитываем при входе
+        user.set_password(password)
+        db.commit()
+    _auth_cache_put(key, user.id, user.password_hash)
     return user
 
 
@@ -122,7 +195,7 @@ def get_current_user(
 
 
 @router.post("/login", response_model=Token)
-async def login_for_access_token(
+def login_for_access_token(
     credentials: HTTPBasicCredentials = Depends(security), db: Session = Depends(get_db)
 ) -> Token:
     """
@@ -167,7 +240,7 @@ async def read_users_me(current_user: User = Depends(get_current_user)) -> User:
 
 
 @router.post("/verify")
-async def verify_credentials(
+def verify_credentials(
     credentials: HTTPBasicCredentials = Depends(security), db: Session = Depends(get_db)
 ) -> Dict[str, str]:
     """
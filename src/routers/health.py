@@ -9,88 +9,118 @@ from typing import Any, Dict
 
 from fastapi import APIRouter
 
-from src.database import ApplicationHealthChecker
+from src.database import get_health_checker
 
 # Создаем роутер для health эндпоинтов
 router = APIRouter()
 
 
 @router.get("/")
-async def health_check() -> Dict[str, Any]:
+def health_check() -> Dict[str, Any]:
     """
-    Эндпоинт для комплексной проверки здоровья приложения.
+    Эндпоинт проверки здоровья приложения.
 
-    Выполняет полную проверку всех компонентов системы:
-    - Переменные окружения
-    - Подключение к базе данных
-    - Наличие необходимых таблиц
-    - Права доступа к БД
-    - Корректность настроек приложения
+    Выполняет лёгкую проверку (переменные окружения и подключение
+    к базе данных), как liveness-проба: эндпоинт часто опрашивают
+    балансировщики и мониторинг. Подробное состояние БД — /database.
+
+    Результат кэшируется на несколько секунд общим экземпляром проверки.
 
     Returns:
-        Dict[str, Any]: Подробный отчет о состоянии всех компонентов.
+        Dict[str, Any]: Отчет о состоянии проверенных компонентов.
     """
-    checker = ApplicationHealthChecker()
-    health_result = checker.perform_full_health_check()
+    checker = get_health_checker()
+    health_result = checker.perform_liveness_check()
 
     return {
         "status": health_result["overall_status"],
-        "timestamp": "2025-09-04T12:00:00Z",  # Можно заменить на datetime.utcnow().isoformat()
+        "timestamp": health_result["timestamp"],
         "version": "1.0.0",
         "checks": health_result["checks"],
     }
 
 
+@router.get("/live")
+def liveness() -> Dict[str, Any]:
+    """
+    Эндпоинт liveness-пробы.
+
+    Лёгкая проверка: переменные окружения и подключение к базе данных.
+
+    Returns:
+        Dict[str, Any]: Общий статус и результаты проверок.
+    """
+    checker = get_health_checker()
+    result = checker.perform_liveness_check()
+    return {"status": result["overall_status"], "checks": result["checks"]}
+
+
+@router.get("/ready")
+def readiness() -> Dict[str, Any]:
+    """
+    Эндпоинт readiness-пробы.
+
+    Проверяет готовность к обработке запросов без тяжёлой проверки
+    прав доступа к базе данных.
+
+    Returns:
+        Dict[str, Any]: Общий статус и результаты проверок.
+    """
+    checker = get_health_checker()
+    result = checker.perform_readiness_check()
+    return {"status": result["overall_status"], "checks": result["checks"]}
+
+
 @router.get("/summary")
-async def health_summary() -> Dict[str, str]:
+def health_summary() -> Dict[str, str]:
     """
     Эндпоинт для получения краткой сводки здоровья приложения.
 
     Returns:
         Dict[str, str]: Краткая сводка состояния приложения.
     """
-    checker = ApplicationHealthChecker()
+    checker = get_health_checker()
     summary = checker.get_health_summary()
 
     return {"summary": summary}
 
 
 @router.get("/database")
-async def database_health() -> Dict[str, Any]:
+def database_health() -> Dict[str, Any]:
     """
     Эндпоинт для проверки здоровья базы данных.
 
     Returns:
         Dict[str, Any]: Состояние подключения и таблиц базы данных.
     """
-    checker = ApplicationHealthChecker()
+    checker = get_health_checker()
 
     return {
         "connection": checker.check_database_connection(),
-        "tables": checker.check_database_tables(),
+        "tables": checker.check_database_tables(include_extra_tables=True),
         "permissions": checker.check_database_permissions(),
     }
 
 
 @router.get("/environment")
-async def environment_health() -> Dict[str, Any]:
+def environment_health() -> Dict[str, Any]:
     """
     Эндпоинт для проверки переменных окружения.
 
     Returns:
         Dict[str, Any]: Состояние переменных окружения.
     """
-    checker = ApplicationHealthChecker()
+    checker = get_health_checker()
     return checker.check_environment_variables()
 
 
 @router.get("/settings")
-async def settings_health() -> Dict[str, Any]:
+def settings_health() -> Dict[str, Any]:
     """
     Эндпоинт для проверки настроек приложения.
 
     Returns:
         Dict[str, Any]: Состояние настроек приложения.
     """
-    checker = ApplicationHealthChecker()
+    checker = get_health_checker()
     return checker.check_application_settings()
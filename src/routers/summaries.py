@@ -7,21 +7,24 @@
 from datetime import datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from pydantic import BaseModel
+from sqlalchemy import delete, func, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from src.database import get_db
+from src.database import get_db, is_foreign_key_violation
 from src.models.enums import ProcessingStatus
 from src.models.summaries import Summary
-from src.models.transcriptions import Transcription
+from src.schemas.base import OrmModel
+from src.utils.pagination import paginate, set_next_cursor
 
 # Создаем роутер для summaries эндпоинтов
 router = APIRouter()
 
 
 # Pydantic модели для API
-class SummaryBase(BaseModel):
+class SummaryBase(OrmModel):
     """Базовая модель сводки для API."""
 
     transcription_id: int
@@ -31,9 +34,6 @@ class SummaryBase(BaseModel):
     key_points: Optional[List[str]] = None
     confidence: Optional[float] = None
 
-    class Config:
-        from_attributes = True
-
 
 class SummaryResponse(SummaryBase):
     """Модель ответа со сводкой."""
@@ -48,35 +48,61 @@ class SummaryCreate(BaseModel):
 
     transcription_id: int
     summary_type: str = "general"
-
-
-@router.get("/", response_model=List[SummaryResponse])
-async def get_summaries(
+    # Обязательные (NOT NULL) столбцы summaries; границы сегмента
+    # по умолчанию — начало записи
+    ai_model_id: int
+    start_time: float = 0.0
+    end_time: float = 0.0
+
+
+# response_model=None: ответ строится через model_construct из уже
+# типизированных столбцов БД без повторной валидации каждой строки
+@router.get(
+    "/",
+    response_model=None,
+    responses={200: {"model": List[SummaryResponse]}},
+)
+def get_summaries(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    status: Optional[ProcessingStatus] = None,
     transcription_id: Optional[int] = None,
     summary_type: Optional[str] = None,
     db: Session = Depends(get_db),
-) -> List[Summary]:
+) -> List[SummaryResponse]:
     """
     Получение списка сводок.
 
     Args:
-        skip: Количество записей для пропуска (пагинация).
+        response: Ответ (заголовок X-Next-Cursor со следующим курсором).
+        skip: Количество записей для пропуска (если курсор не задан).
         limit: Максимальное количество записей для возврата.
-        status: Фильтр по статусу.
+        cursor: Курсор следующей страницы (keyset-пагинация).
+        status: Фильтр по статусу (неизвестное значение — ошибка 422).
         transcription_id: Фильтр по ID транскрибации.
         summary_type: Фильтр по типу сводки.
         db: Сессия базы данных.
 
     Returns:
-        List[Summary]: Список сводок.
+        List[SummaryResponse]: Список сводок.
     """
-    query = db.query(Summary)
+    # Выбираем только столбцы SummaryResponse (без text_summary_en/ru)
+    query = db.query(
+        Summary.id,
+        Summary.transcription_id,
+        Summary.summary_type,
+        Summary.status,
+        Summary.summary_text,
+        Summary.key_points,
+        Summary.confidence,
+        Summary.created_at,
+        Summary.updated_at,
+    )
 
     if status:
-        query = query.filter(Summary.status == ProcessingStatus(status))
+        query = query.filter(Summary.status == status)
 
     if transcription_id:
         query = query.filter(Summary.transcription_id == transcription_id)
@@ -84,12 +110,26 @@ async def get_summaries(
     if summary_type:
         query = query.filter(Summary.summary_type == summary_type)
 
-    summaries = query.offset(skip).limit(limit).all()
-    return summaries
+    rows = paginate(query, Summary.id, cursor, skip, limit).all()
+    set_next_cursor(response, rows, limit)
+    return [
+        SummaryResponse.model_construct(
+            id=row.id,
+            transcription_id=row.transcription_id,
+            summary_type=row.summary_type,
+            status=row.status.value,
+            summary_text=row.summary_text,
+            key_points=row.key_points,
+            confidence=row.confidence,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+        for row in rows
+    ]
 
 
 @router.get("/{summary_id}", response_model=SummaryResponse)
-async def get_summary(summary_id: int, db: Session = Depends(get_db)) -> Summary:
+def get_summary(summary_id: int, db: Session = Depends(get_db)) -> Summary:
     """
     Получение сводки по ID.
 
@@ -103,14 +143,14 @@ async def get_summary(summary_id: int, db: Session = Depends(get_db)) -> Summary
     Raises:
         HTTPException: Если сводка не найдена.
     """
-    summary = db.query(Summary).filter(Summary.id == summary_id).first()
+    summary = db.get(Summary, summary_id)
     if summary is None:
         raise HTTPException(status_code=404, detail="Сводка не найдена")
     return summary
 
 
 @router.post("/", response_model=SummaryResponse)
-async def create_summary(
+def create_summary(
     summary_data: SummaryCreate, db: Session = Depends(get_db)
 ) -> Summary:
     """
@@ -124,20 +164,20 @@ async def create_summary(
         Summary: Созданная сводка.
 
     Raises:
-        HTTPException: Если транскрибация не найдена.
+        HTTPException: Если транскрибация или AI модель не найдены либо
+            данные нарушают ограничения таблицы.
     """
-    # Проверяем существование транскрибации
-    transcription = (
-        db.query(Transcription)
-        .filter(Transcription.id == summary_data.transcription_id)
-        .first()
-    )
-    if transcription is None:
-        raise HTTPException(status_code=404, detail="Транскрибация не найдена")
-
-    # Создаем сводку
+    # Создаем сводку (существование транскрибации и AI модели проверяют
+    # внешние ключи); все NOT NULL столбцы заполняются до INSERT, иначе
+    # нарушение NOT NULL скрыло бы отсутствие родительской записи
     db_summary = Summary()
     db_summary.summary_type = summary_data.summary_type
+    db_summary.ai_model_id = summary_data.ai_model_id
+    # Текст сводки еще не получен
+    db_summary.text_summary_en = ""
+    db_summary.text_summary_ru = ""
+    db_summary.start_time = summary_data.start_time
+    db_summary.end_time = summary_data.end_time
     db_summary.status = ProcessingStatus.PENDING
 
     # link to transcription by id
@@ -145,14 +185,22 @@ async def create_summary(
     db_summary.translation_id = None
 
     db.add(db_summary)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if is_foreign_key_violation(e):
+            raise HTTPException(
+                status_code=404, detail="Транскрибация или AI модель не найдены"
+            )
+        raise HTTPException(status_code=422, detail="Некорректные данные сводки")
     db.refresh(db_summary)
 
     return db_summary
 
 
 @router.put("/{summary_id}", response_model=SummaryResponse)
-async def update_summary(
+def update_summary(
     summary_id: int,
     summary_text: str,
     key_points: Optional[List[str]] = None,
@@ -175,26 +223,33 @@ async def update_summary(
     Raises:
         HTTPException: Если сводка не найдена.
     """
-    summary = db.query(Summary).filter(Summary.id == summary_id).first()
-    if summary is None:
-        raise HTTPException(status_code=404, detail="Сводка не найдена")
-
-    # Обновляем данные
-    summary.summary_text = summary_text
-    summary.status = ProcessingStatus.COMPLETED
+    # Один UPDATE ... RETURNING вместо SELECT + UPDATE; updated_at
+    # выставляет onupdate=func.now() столбца
+    values: dict = {
+        "summary_text": summary_text,
+        "status": ProcessingStatus.COMPLETED,
+    }
     if key_points is not None:
-        summary.key_points = key_points
+        values["key_points"] = key_points
     if confidence is not None:
-        summary.confidence = confidence
+        values["confidence"] = confidence
+    summary = db.scalar(
+        update(Summary)
+        .where(Summary.id == summary_id)
+        .values(**values)
+        .returning(Summary)
+        .execution_options(synchronize_session=False)
+    )
+    if summary is None:
+        raise HTTPException(status_code=404, detail="Сводка не найдена")
 
     db.commit()
-    db.refresh(summary)
 
     return summary
 
 
 @router.delete("/{summary_id}")
-async def delete_summary(summary_id: int, db: Session = Depends(get_db)) -> dict:
+def delete_summary(summary_id: int, db: Session = Depends(get_db)) -> dict:
     """
     Удаление сводки.
 
@@ -208,18 +263,23 @@ async def delete_summary(summary_id: int, db: Session = Depends(get_db)) -> dict
     Raises:
         HTTPException: Если сводка не найдена.
     """
-    summary = db.query(Summary).filter(Summary.id == summary_id).first()
-    if summary is None:
+    # Один DELETE ... RETURNING вместо SELECT + DELETE
+    deleted_id = db.scalar(
+        delete(Summary)
+        .where(Summary.id == summary_id)
+        .returning(Summary.id)
+        .execution_options(synchronize_session=False)
+    )
+    if deleted_id is None:
         raise HTTPException(status_code=404, detail="Сводка не найдена")
 
-    db.delete(summary)
     db.commit()
 
     return {"message": "Сводка успешно удалена"}
 
 
 @router.get("/stats/summary")
-async def get_summary_stats(db: Session = Depends(get_db)) -> dict:
+def get_summary_stats(db: Session = Depends(get_db)) -> dict:
     """
     Получение статистики по сводкам.
 
@@ -229,21 +289,20 @@ async def get_summary_stats(db: Session = Depends(get_db)) -> dict:
     Returns:
         dict: Статистика по сводкам.
     """
-    total_summaries = db.query(Summary).count()
-
-    # Статистика по статусам
-    status_stats = db.query(Summary.status).all()
+    # Один GROUP BY по паре (статус, тип): строк не больше числа сочетаний,
+    # итоги и обе разбивки собираются из них
+    grouped = (
+        db.query(Summary.status, Summary.summary_type, func.count())
+        .group_by(Summary.status, Summary.summary_type)
+        .all()
+    )
+    total_summaries = 0
     status_counts: dict[str, int] = {}
-    for status_tuple in status_stats:
-        status = status_tuple[0]
-        status_counts[status] = status_counts.get(status, 0) + 1
-
-    # Статистика по типам сводок
-    type_stats = db.query(Summary.summary_type).all()
     type_counts: dict[str, int] = {}
-    for type_tuple in type_stats:
-        summary_type = type_tuple[0]
-        type_counts[summary_type] = type_counts.get(summary_type, 0) + 1
+    for status, summary_type, count in grouped:
+        total_summaries += count
+        status_counts[status] = status_counts.get(status, 0) + count
+        type_counts[summary_type] = type_counts.get(summary_type, 0) + count
 
     return {
         "total_summaries": total_summaries,
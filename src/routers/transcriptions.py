@@ -7,21 +7,26 @@
 from datetime import datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from pydantic import BaseModel
+from sqlalchemy import delete, func, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from src.database import get_db
-from src.models.audio_files import AudioFile
+from src.database import get_db, is_foreign_key_violation
 from src.models.enums import ProcessingStatus
+from src.models.transcription_segments import TranscriptionSegments
 from src.models.transcriptions import Transcription
+from src.schemas.base import OrmModel
+from src.services.transcription_service import TranscriptionService
+from src.utils.pagination import paginate, set_next_cursor
 
 # Создаем роутер для transcriptions эндпоинтов
 router = APIRouter()
 
 
 # Pydantic модели для API
-class TranscriptionBase(BaseModel):
+class TranscriptionBase(OrmModel):
     """Базовая модель транскрибации для API."""
 
     audio_file_id: int
@@ -30,9 +35,6 @@ class TranscriptionBase(BaseModel):
     text: Optional[str] = None
     confidence: Optional[float] = None
 
-    class Config:
-        from_attributes = True
-
 
 class TranscriptionResponse(TranscriptionBase):
     """Модель ответа с транскрибацией."""
@@ -41,8 +43,14 @@ class TranscriptionResponse(TranscriptionBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+
+class TranscriptionSegmentsResponse(OrmModel):
+    """Модель ответа с сегментами транскрибации аудиофайла."""
+
+    audio_file_id: int
+    start_times: List[float]
+    end_times: List[float]
+    texts: List[str]
 
 
 class TranscriptionCreate(BaseModel):
@@ -50,43 +58,81 @@ class TranscriptionCreate(BaseModel):
 
     audio_file_id: int
     language: str = "auto"
-
-
-@router.get("/", response_model=List[TranscriptionResponse])
-async def get_transcriptions(
+    # Обязательные (NOT NULL) столбцы transcriptions; границы сегмента
+    # по умолчанию — начало записи
+    ai_model_id: int
+    start_time: float = 0.0
+    end_time: float = 0.0
+
+
+# response_model=None: ответ строится через model_construct из уже
+# типизированных столбцов БД без повторной валидации каждой строки
+@router.get(
+    "/",
+    response_model=None,
+    responses={200: {"model": List[TranscriptionResponse]}},
+)
+def get_transcriptions(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    status: Optional[ProcessingStatus] = None,
     audio_file_id: Optional[int] = None,
     db: Session = Depends(get_db),
-) -> List[Transcription]:
+) -> List[TranscriptionResponse]:
     """
     Получение списка транскрибаций.
 
     Args:
-        skip: Количество записей для пропуска (пагинация).
+        response: Ответ (заголовок X-Next-Cursor со следующим курсором).
+        skip: Количество записей для пропуска (если курсор не задан).
         limit: Максимальное количество записей для возврата.
-        status: Фильтр по статусу.
+        cursor: Курсор следующей страницы (keyset-пагинация).
+        status: Фильтр по статусу (неизвестное значение — ошибка 422).
         audio_file_id: Фильтр по ID аудиофайла.
         db: Сессия базы данных.
 
     Returns:
-        List[Transcription]: Список транскрибаций.
+        List[TranscriptionResponse]: Список транскрибаций.
     """
-    query = db.query(Transcription)
+    # Выбираем только столбцы TranscriptionResponse
+    query = db.query(
+        Transcription.id,
+        Transcription.audio_file_id,
+        Transcription.language,
+        Transcription.status,
+        Transcription.text_transcription,
+        Transcription.confidence,
+        Transcription.created_at,
+        Transcription.updated_at,
+    )
 
     if status:
-        query = query.filter(Transcription.status == ProcessingStatus(status))
+        query = query.filter(Transcription.status == status)
 
     if audio_file_id:
         query = query.filter(Transcription.audio_file_id == audio_file_id)
 
-    transcriptions = query.offset(skip).limit(limit).all()
-    return transcriptions
+    rows = paginate(query, Transcription.id, cursor, skip, limit).all()
+    set_next_cursor(response, rows, limit)
+    return [
+        TranscriptionResponse.model_construct(
+            id=row.id,
+            audio_file_id=row.audio_file_id,
+            language=row.language,
+            status=row.status.value,
+            text=row.text_transcription,
+            confidence=row.confidence,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+        for row in rows
+    ]
 
 
 @router.get("/{transcription_id}", response_model=TranscriptionResponse)
-async def get_transcription(
+def get_transcription(
     transcription_id: int, db: Session = Depends(get_db)
 ) -> Transcription:
     """
@@ -102,16 +148,14 @@ async def get_transcription(
     Raises:
         HTTPException: Если транскрибация не найдена.
     """
-    transcription = (
-        db.query(Transcription).filter(Transcription.id == transcription_id).first()
-    )
+    transcription = db.get(Transcription, transcription_id)
     if transcription is None:
         raise HTTPException(status_code=404, detail="Транскрибация не найдена")
     return transcription
 
 
 @router.post("/", response_model=TranscriptionResponse)
-async def create_transcription(
+def create_transcription(
     transcription_data: TranscriptionCreate, db: Session = Depends(get_db)
 ) -> Transcription:
     """
@@ -125,33 +169,45 @@ async def create_transcription(
         Transcription: Созданная транскрибация.
 
     Raises:
-        HTTPException: Если аудиофайл не найден.
+        HTTPException: Если аудиофайл или AI модель не найдены либо данные
+            нарушают ограничения таблицы.
     """
-    # Проверяем существование аудиофайла
-    audio_file = (
-        db.query(AudioFile)
-        .filter(AudioFile.id == transcription_data.audio_file_id)
-        .first()
-    )
-    if audio_file is None:
-        raise HTTPException(status_code=404, detail="Аудиофайл не найден")
-
-    # Создаем транскрибацию
-    # Create transcription via attribute assignment
+    # Создаем транскрибацию (существование аудиофайла и AI модели проверяют
+    # внешние ключи); все NOT NULL столбцы заполняются до INSERT, иначе
+    # нарушение NOT NULL скрыло бы отсутствие родительской записи
     db_transcription = Transcription()
     db_transcription.audio_file_id = transcription_data.audio_file_id
+    db_transcription.ai_model_id = transcription_data.ai_model_id
     db_transcription.language = transcription_data.language
+    # Текст еще не распознан
+    db_transcription.text_transcription = ""
+    db_transcription.start_time = transcription_data.start_time
+    db_transcription.end_time = transcription_data.end_time
     db_transcription.status = ProcessingStatus.PENDING
 
     db.add(db_transcription)
-    db.commit()
+    try:
+        # flush до пересборки сегментов: INSERT ... SELECT должен увидеть
+        # новую строку (autoflush отключен)
+        db.flush()
+        TranscriptionService.refresh_segments(db, db_transcription.audio_file_id)
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if is_foreign_key_violation(e):
+            raise HTTPException(
+                status_code=404, detail="Аудиофайл или AI модель не найдены"
+            )
+        raise HTTPException(
+            status_code=422, detail="Некорректные данные транскрибации"
+        )
     db.refresh(db_transcription)
 
     return db_transcription
 
 
 @router.put("/{transcription_id}", response_model=TranscriptionResponse)
-async def update_transcription(
+def update_transcription(
     transcription_id: int,
     text: str,
     confidence: Optional[float] = None,
@@ -172,26 +228,32 @@ async def update_transcription(
     Raises:
         HTTPException: Если транскрибация не найдена.
     """
-    transcription = (
-        db.query(Transcription).filter(Transcription.id == transcription_id).first()
+    # Один UPDATE ... RETURNING вместо SELECT + UPDATE; updated_at
+    # выставляет onupdate=func.now() столбца
+    values: dict = {
+        "text_transcription": text,
+        "status": ProcessingStatus.COMPLETED,
+    }
+    if confidence is not None:
+        values["confidence"] = confidence
+    transcription = db.scalar(
+        update(Transcription)
+        .where(Transcription.id == transcription_id)
+        .values(**values)
+        .returning(Transcription)
+        .execution_options(synchronize_session=False)
     )
     if transcription is None:
         raise HTTPException(status_code=404, detail="Транскрибация не найдена")
 
-    # Обновляем данные
-    transcription.text = text
-    transcription.status = ProcessingStatus.COMPLETED
-    if confidence is not None:
-        transcription.confidence = confidence
-
+    TranscriptionService.refresh_segments(db, transcription.audio_file_id)
     db.commit()
-    db.refresh(transcription)
 
     return transcription
 
 
 @router.delete("/{transcription_id}")
-async def delete_transcription(
+def delete_transcription(
     transcription_id: int, db: Session = Depends(get_db)
 ) -> dict:
     """
@@ -207,20 +269,47 @@ async def delete_transcription(
     Raises:
         HTTPException: Если транскрибация не найдена.
     """
-    transcription = (
-        db.query(Transcription).filter(Transcription.id == transcription_id).first()
+    # Один DELETE ... RETURNING вместо SELECT + DELETE; переводы удаляет БД
+    audio_file_id = db.scalar(
+        delete(Transcription)
+        .where(Transcription.id == transcription_id)
+        .returning(Transcription.audio_file_id)
+        .execution_options(synchronize_session=False)
     )
-    if transcription is None:
+    if audio_file_id is None:
         raise HTTPException(status_code=404, detail="Транскрибация не найдена")
 
-    db.delete(transcription)
+    TranscriptionService.refresh_segments(db, audio_file_id)
     db.commit()
 
     return {"message": "Транскрибация успешно удалена"}
 
 
+@router.get("/segments/{audio_file_id}", response_model=TranscriptionSegmentsResponse)
+def get_transcription_segments(
+    audio_file_id: int, db: Session = Depends(get_db)
+) -> TranscriptionSegments:
+    """
+    Получение всех сегментов транскрибации аудиофайла в виде массивов.
+
+    Args:
+        audio_file_id: ID аудиофайла.
+        db: Сессия базы данных.
+
+    Returns:
+        TranscriptionSegments: Массивы границ и текстов сегментов.
+
+    Raises:
+        HTTPException: Если у аудиофайла нет транскрибаций.
+    """
+    segments = TranscriptionService.get_segments(db, audio_file_id)
+    if segments is None:
+        raise HTTPException(status_code=404, detail="Транскрибации не найдены")
+    return segments
+
+
 @router.get("/stats/summary")
-async def get_transcription_stats(db: Session = Depends(get_db)) -> dict:
+def get_transcription_stats(db: Session = Depends(get_db)) -> dict:
     """
     Получение статистики по транскрибациям.
 
@@ -230,21 +319,20 @@ async def get_transcription_stats(db: Session = Depends(get_db)) -> dict:
     Returns:
         dict: Статистика по транскрибациям.
     """
-    total_transcriptions = db.query(Transcription).count()
-
-    # Статистика по статусам
-    status_stats = db.query(Transcription.status).all()
+    # Один GROUP BY по паре (статус, язык): строк не больше числа сочетаний,
+    # итоги и обе разбивки собираются из них
+    grouped = (
+        db.query(Transcription.status, Transcription.language, func.count())
+        .group_by(Transcription.status, Transcription.language)
+        .all()
+    )
+    total_transcriptions = 0
     status_counts: dict[str, int] = {}
-    for status_tuple in status_stats:
-        status = status_tuple[0]
-        status_counts[status] = status_counts.get(status, 0) + 1
-
-    # Статистика по языкам
-    language_stats = db.query(Transcription.language).all()
     language_counts: dict[str, int] = {}
-    for lang_tuple in language_stats:
-        lang = lang_tuple[0]
-        language_counts[lang] = language_counts.get(lang, 0) + 1
+    for status, lang, count in grouped:
+        total_transcriptions += count
+        status_counts[status] = status_counts.get(status, 0) + count
+        language_counts[lang] = language_counts.get(lang, 0) + count
 
     return {
         "total_transcriptions": total_transcriptions,
@@ -4,24 +4,76 @@
 Этот модуль содержит эндпоинты для создания, получения и управления переводами текста.
 """
 
+import threading
+import time
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
+from sqlalchemy import case, delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.database import get_db
+from src.database import get_async_db, get_db, is_foreign_key_violation
 from src.models.enums import ProcessingStatus
-from src.models.transcriptions import Transcription
 from src.models.translations import Translation
+from src.schemas.base import OrmModel
 
 # Создаем роутер для translations эндпоинтов
 router = APIRouter()
 
+# Кэш статистики в памяти процесса: (момент истечения, результат).
+# Кэш свой у каждого воркера: сбрасывается при изменении переводов через
+# этот роутер в том же процессе, а изменения в других воркерах и каскадные
+# удаления (вместе с транскрибацией) учитываются по истечении TTL
+STATS_CACHE_TTL_SECONDS = 10.0
+_stats_cache: Optional[Tuple[float, dict]] = None
+# Поколение кэша растет при каждом сбросе: статистика, посчитанная до
+# изменения, не попадает в кэш после него
+_stats_cache_generation = 0
+# Кэш читают async-эндпоинт и сбрасывают синхронные эндпоинты из пула потоков
+_stats_cache_lock = threading.Lock()
+
+
+def _invalidate_stats_cache() -> None:
+    """Сбрасывает кэш статистики после изменения переводов."""
+    global _stats_cache, _stats_cache_generation
+    with _stats_cache_lock:
+        _stats_cache = None
+        _stats_cache_generation += 1
+
+
+def _stats_cache_get() -> Tuple[Optional[dict], int]:
+    """Возвращает (статистика из кэша или None, текущее поколение кэша)."""
+    with _stats_cache_lock:
+        if _stats_cache is not None and _stats_cache[0] > time.monotonic():
+            return _stats_cache[1], _stats_cache_generation
+        return None, _stats_cache_generation
+
+
+def _stats_cache_put(stats: dict, generation: int) -> None:
+    """Запоминает статистику, если кэш не сбрасывался с начала ее подсчета."""
+    global _stats_cache
+    with _stats_cache_lock:
+        if generation == _stats_cache_generation:
+            _stats_cache = (time.monotonic() + STATS_CACHE_TTL_SECONDS, stats)
+
+
+# Целевой язык не хранится в БД: определяем его по заполненному столбцу
+# перевода (пустая строка — язык не определен)
+_HAS_EN = func.coalesce(Translation.text_translation_en, "") != ""
+_HAS_RU = func.coalesce(Translation.text_translation_ru, "") != ""
+_TARGET_LANGUAGE = case(
+    (_HAS_EN & ~_HAS_RU, "en"),
+    (_HAS_RU & ~_HAS_EN, "ru"),
+    else_="",
+)
+
 
 # Pydantic модели для API
-class TranslationBase(BaseModel):
+class TranslationBase(OrmModel):
     """Базовая модель перевода для API."""
 
     transcription_id: int
@@ -30,9 +82,6 @@ class TranslationBase(BaseModel):
     translated_text: Optional[str] = None
     confidence: Optional[float] = None
 
-    class Config:
-        from_attributes = True
-
 
 class TranslationResponse(TranslationBase):
     """Модель ответа с переводом."""
@@ -47,57 +96,94 @@ class TranslationCreate(BaseModel):
 
     transcription_id: int
     target_language: str
-
-
-@router.get("/", response_model=List[TranslationResponse])
+    # Обязательные (NOT NULL) столбцы translations; границы сегмента
+    # по умолчанию — начало записи
+    ai_model_id: int
+    start_time: float = 0.0
+    end_time: float = 0.0
+
+
+# response_model=None: ответ строится через model_construct из уже
+# типизированных столбцов БД без повторной валидации каждой строки
+@router.get(
+    "/",
+    response_model=None,
+    responses={200: {"model": List[TranslationResponse]}},
+)
 async def get_translations(
     skip: int = 0,
     limit: int = 100,
-    status: Optional[str] = None,
+    status: Optional[ProcessingStatus] = None,
     transcription_id: Optional[int] = None,
     target_language: Optional[str] = None,
-    db: Session = Depends(get_db),
-) -> List[Translation]:
+    db: AsyncSession = Depends(get_async_db),
+) -> List[TranslationResponse]:
     """
     Получение списка переводов.
 
+    Запрос выполняется асинхронно (asyncpg) и не занимает поток из пула.
+
     Args:
         skip: Количество записей для пропуска (пагинация).
         limit: Максимальное количество записей для возврата.
-        status: Фильтр по статусу.
+        status: Фильтр по статусу (неизвестное значение — ошибка 422).
         transcription_id: Фильтр по ID транскрибации.
-        target_language: Фильтр по целевому языку.
+        target_language: Фильтр по целевому языку (en/ru).
         db: Сессия базы данных.
 
     Returns:
-        List[Translation]: Список переводов.
+        List[TranslationResponse]: Список переводов.
     """
-    query = db.query(Translation)
+    # Выбираем только значения TranslationResponse, без ORM-объектов
+    stmt = select(
+        Translation.id,
+        Translation.transcription_id,
+        _TARGET_LANGUAGE.label("target_language"),
+        Translation.status,
+        func.coalesce(
+            func.nullif(Translation.text_translation_en, ""),
+            Translation.text_translation_ru,
+        ).label("translated_text"),
+        Translation.confidence,
+        Translation.created_at,
+        Translation.updated_at,
+    )
 
     if status:
-        query = query.filter(Translation.status == ProcessingStatus(status))
+        stmt = stmt.where(Translation.status == status)
 
     if transcription_id:
-        query = query.filter(Translation.transcription_id == transcription_id)
-
-    # If target_language filter provided, we'll filter results in Python after loading
+        stmt = stmt.where(Translation.transcription_id == transcription_id)
 
-    translations = query.offset(skip).limit(limit).all()
     if target_language:
-        # filter by transient requested language stored on instances (set at creation time)
-        translations = [
-            t for t in translations if getattr(t, "_requested_target_language", None) == target_language
-        ]
-    return translations
+        # Фильтр в SQL до OFFSET/LIMIT: страница заполняется целиком
+        stmt = stmt.where(_TARGET_LANGUAGE == target_language)
+
+    rows = (await db.execute(stmt.offset(skip).limit(limit))).all()
+    return [
+        TranslationResponse.model_construct(
+            id=row.id,
+            transcription_id=row.transcription_id,
+            target_language=row.target_language,
+            status=row.status.value,
+            translated_text=row.translated_text,
+            confidence=row.confidence,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+        for row in rows
+    ]
 
 
 @router.get("/{translation_id}", response_model=TranslationResponse)
 async def get_translation(
-    translation_id: int, db: Session = Depends(get_db)
+    translation_id: int, db: AsyncSession = Depends(get_async_db)
 ) -> Translation:
     """
     Получение перевода по ID.
 
+    Запрос выполняется асинхронно (asyncpg) и не занимает поток из пула.
+
     Args:
         translation_id: ID перевода.
         db: Сессия базы данных.
@@ -108,14 +194,14 @@ async def get_translation(
     Raises:
         HTTPException: Если перевод не найден.
     """
-    translation = db.query(Translation).filter(Translation.id == translation_id).first()
+    translation = await db.get(Translation, translation_id)
     if translation is None:
         raise HTTPException(status_code=404, detail="Перевод не найден")
     return translation
 
 
 @router.post("/", response_model=TranslationResponse)
-async def create_translation(
+def create_translation(
     translation_data: TranslationCreate, db: Session = Depends(get_db)
 ) -> Translation:
     """
@@ -129,33 +215,97 @@ async def create_translation(
         Translation: Созданный перевод.
 
     Raises:
-        HTTPException: Если транскрибация не найдена.
+        HTTPException: Если транскрибация или AI модель не найдены либо
+            данные нарушают ограничения таблицы.
     """
-    # Проверяем существование транскрибации
-    transcription = (
-        db.query(Transcription)
-        .filter(Transcription.id == translation_data.transcription_id)
-        .first()
-    )
-    if transcription is None:
-        raise HTTPException(status_code=404, detail="Транскрибация не найдена")
-
-    # Создаем перевод (attribute-assignment to satisfy typing plugin)
+    # Создаем перевод (существование транскрибации и AI модели проверяют
+    # внешние ключи); все NOT NULL столбцы заполняются до INSERT, иначе
+    # нарушение NOT NULL скрыло бы отсутствие родительской записи
+    # (attribute-assignment to satisfy typing plugin)
     db_translation = Translation()
     db_translation.transcription_id = translation_data.transcription_id
+    db_translation.ai_model_id = translation_data.ai_model_id
+    # Текст перевода еще не получен
+    db_translation.text_translation_en = ""
+    db_translation.text_translation_ru = ""
+    db_translation.start_time = translation_data.start_time
+    db_translation.end_time = translation_data.end_time
     # store requested target language transiently on the instance (not a DB column)
     setattr(db_translation, "_requested_target_language", translation_data.target_language)
     db_translation.status = ProcessingStatus.PENDING
 
     db.add(db_translation)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if is_foreign_key_violation(e):
+            raise HTTPException(
+                status_code=404, detail="Транскрибация или AI модель не найдены"
+            )
+        raise HTTPException(status_code=422, detail="Некорректные данные перевода")
+    _invalidate_stats_cache()
     db.refresh(db_translation)
 
     return db_translation
 
 
+@router.post("/bulk")
+def create_translations_bulk(
+    translations_data: List[TranslationCreate], db: Session = Depends(get_db)
+) -> dict:
+    """
+    Массовое создание переводов.
+
+    Все строки уходят одним executemany, который драйвер собирает
+    в многострочные INSERT ... VALUES ... RETURNING id.
+
+    Args:
+        translations_data: Данные переводов.
+        db: Сессия базы данных.
+
+    Returns:
+        dict: Количество и ID созданных переводов.
+
+    Raises:
+        HTTPException: Если транскрибация или AI модель не найдены либо
+            данные нарушают ограничения таблицы.
+    """
+    # Текст перевода еще не получен: столбцы NOT NULL заполняются пустыми
+    # строками (целевой язык определится по заполненному столбцу)
+    rows = [
+        {
+            "transcription_id": translation_data.transcription_id,
+            "ai_model_id": translation_data.ai_model_id,
+            "text_translation_en": "",
+            "text_translation_ru": "",
+            "start_time": translation_data.start_time,
+            "end_time": translation_data.end_time,
+            "status": ProcessingStatus.PENDING,
+        }
+        for translation_data in translations_data
+    ]
+    if not rows:
+        return {"created": 0, "ids": []}
+
+    # Существование транскрибаций и AI моделей проверяют внешние ключи при INSERT
+    stmt = insert(Translation).returning(Translation.id, sort_by_parameter_order=True)
+    try:
+        ids = list(db.scalars(stmt, rows))
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if is_foreign_key_violation(e):
+            raise HTTPException(
+                status_code=404, detail="Транскрибация или AI модель не найдены"
+            )
+        raise HTTPException(status_code=422, detail="Некорректные данные перевода")
+    _invalidate_stats_cache()
+    return {"created": len(ids), "ids": ids}
+
+
 @router.put("/{translation_id}", response_model=TranslationResponse)
-async def update_translation(
+def update_translation(
     translation_id: int,
     translated_text: str,
     confidence: Optional[float] = None,
@@ -176,29 +326,34 @@ async def update_translation(
     Raises:
         HTTPException: Если перевод не найден.
     """
-    translation = db.query(Translation).filter(Translation.id == translation_id).first()
+    # Один UPDATE ... RETURNING вместо SELECT + UPDATE; updated_at
+    # выставляет onupdate=func.now() столбца.
+    # Запрошенный язык (_requested_target_language) не хранится в БД и у
+    # записи, загруженной заново, отсутствует — текст пишется в столбец en
+    values: dict = {
+        "text_translation_en": translated_text,
+        "status": ProcessingStatus.COMPLETED,
+    }
+    if confidence is not None:
+        values["confidence"] = confidence
+    translation = db.scalar(
+        update(Translation)
+        .where(Translation.id == translation_id)
+        .values(**values)
+        .returning(Translation)
+        .execution_options(synchronize_session=False)
+    )
     if translation is None:
         raise HTTPException(status_code=404, detail="Перевод не найден")
 
-    # Обновляем данные: сохраняем в language-specific столбцы
-    requested = getattr(translation, "_requested_target_language", None)
-    target = requested if isinstance(requested, str) else "en"
-    if target.lower().startswith("ru"):
-        translation.text_translation_ru = translated_text
-    else:
-        translation.text_translation_en = translated_text
-    translation.status = ProcessingStatus.COMPLETED
-    if confidence is not None:
-        translation.confidence = confidence
-
     db.commit()
-    db.refresh(translation)
+    _invalidate_stats_cache()
 
     return translation
 
 
 @router.delete("/{translation_id}")
-async def delete_translation(
+def delete_translation(
     translation_id: int, db: Session = Depends(get_db)
 ) -> dict:
     """
@@ -214,53 +369,63 @@ async def delete_translation(
     Raises:
         HTTPException: Если перевод не найден.
     """
-    translation = db.query(Translation).filter(Translation.id == translation_id).first()
-    if translation is None:
+    # Один DELETE ... RETURNING вместо SELECT + DELETE; суммаризации удаляет БД
+    deleted_id = db.scalar(
+        delete(Translation)
+        .where(Translation.id == translation_id)
+        .returning(Translation.id)
+        .execution_options(synchronize_session=False)
+    )
+    if deleted_id is None:
         raise HTTPException(status_code=404, detail="Перевод не найден")
 
-    db.delete(translation)
     db.commit()
+    _invalidate_stats_cache()
 
     return {"message": "Перевод успешно удален"}
 
 
 @router.get("/stats/summary")
-async def get_translation_stats(db: Session = Depends(get_db)) -> dict:
+async def get_translation_stats(db: AsyncSession = Depends(get_async_db)) -> dict:
     """
     Получение статистики по переводам.
 
+    Запрос выполняется асинхронно (asyncpg) и не занимает поток из пула.
+    Результат кэшируется на STATS_CACHE_TTL_SECONDS.
+
     Args:
         db: Сессия базы данных.
 
     Returns:
         dict: Статистика по переводам.
     """
-    total_translations = db.query(Translation).count()
-
-    # Статистика по статусам
-    status_stats = db.query(Translation.status).all()
+    cached, generation = _stats_cache_get()
+    if cached is not None:
+        return cached
+
+    language = _TARGET_LANGUAGE
+
+    # Один GROUP BY по паре (статус, язык): строк не больше числа сочетаний,
+    # итоги и обе разбивки собираются из них
+    grouped = (
+        await db.execute(
+            select(Translation.status, language, func.count()).group_by(
+                Translation.status, language
+            )
+        )
+    ).all()
+    total_translations = 0
     status_counts: dict[str, int] = {}
-    for status_tuple in status_stats:
-        status = status_tuple[0]
-        status_counts[status] = status_counts.get(status, 0) + 1
-
-    # Статистика по целевым языкам (derive from translations loaded)
-    all_translations = db.query(Translation).all()
     language_counts: dict[str, int] = {}
-    for t in all_translations:
-        requested = getattr(t, "_requested_target_language", None)
-        if isinstance(requested, str):
-            lang = requested
-        elif t.text_translation_en and not t.text_translation_ru:
-            lang = "en"
-        elif t.text_translation_ru and not t.text_translation_en:
-            lang = "ru"
-        else:
-            lang = ""
-        language_counts[lang] = language_counts.get(lang, 0) + 1
-
-    return {
+    for status, lang, count in grouped:
+        total_translations += count
+        status_counts[status] = status_counts.get(status, 0) + count
+        language_counts[lang] = language_counts.get(lang, 0) + count
+
+    stats = {
         "total_translations": total_translations,
         "status_distribution": status_counts,
         "target_language_distribution": language_counts,
     }
+    _stats_cache_put(stats, generation)
+    return stats
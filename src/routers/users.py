@@ -8,27 +8,26 @@
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, raiseload
 
-from src.database import get_db
+from src.database import get_async_db, get_db
 from src.services.user_service import UserService
 from src.models.users import User
+from src.schemas.base import OrmModel
 
 # Создаем роутер для users эндпоинтов
 router = APIRouter()
 
 
 # Pydantic модели для API
-class UserBase(BaseModel):
+class UserBase(OrmModel):
     """Базовая модель пользователя для API."""
 
     username: str
     is_admin: Optional[bool] = False
 
-    class Config:
-        from_attributes = True
-
 
 class UserCreate(UserBase):
     """Модель для создания пользователя."""
@@ -41,17 +40,16 @@ class UserResponse(UserBase):
 
     id: int
 
-    class Config:
-        from_attributes = True
-
 
 @router.get("/", response_model=List[UserResponse])
 async def get_users(
-    skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+    skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_db)
 ) -> List[User]:
     """
     Получение списка всех пользователей.
 
+    Запрос выполняется асинхронно (asyncpg) и не занимает поток из пула.
+
     Args:
         skip: Количество пользователей для пропуска (пагинация).
         limit: Максимальное количество пользователей для возврата.
@@ -60,15 +58,20 @@ async def get_users(
     Returns:
         List[User]: Список пользователей.
     """
-    users = db.query(User).offset(skip).limit(limit).all()
-    return users
+    # UserResponse не содержит связей: raiseload("*") не даст сериализации
+    # незаметно загружать audio_files для каждого пользователя
+    stmt = select(User).options(raiseload("*")).offset(skip).limit(limit)
+    users = (await db.scalars(stmt)).all()
+    return list(users)
 
 
 @router.get("/{user_id}", response_model=UserResponse)
-async def get_user(user_id: int, db: Session = Depends(get_db)) -> User:
+async def get_user(user_id: int, db: AsyncSession = Depends(get_async_db)) -> User:
     """
     Получение пользователя по ID.
 
+    Запрос выполняется асинхронно (asyncpg) и не занимает поток из пула.
+
     Args:
         user_id: ID пользователя.
         db: Сессия базы данных.
@@ -79,14 +82,14 @@ async def get_user(user_id: int, db: Session = Depends(get_db)) -> User:
     Raises:
         HTTPException: Если пользователь не найден.
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if user is None:
         raise HTTPException(status_code=404, detail="Пользователь не найден")
     return user
 
 
 @router.post("/", response_model=UserResponse)
-async def create_user(user: UserCreate, db: Session = Depends(get_db)) -> User:
+def create_user(user: UserCreate, db: Session = Depends(get_db)) -> User:
     """
     Создание нового пользователя.
 
@@ -109,7 +112,7 @@ async def create_user(user: UserCreate, db: Session = Depends(get_db)) -> User:
 
 
 @router.put("/{user_id}", response_model=UserResponse)
-async def update_user(
+def update_user(
     user_id: int, user_update: UserBase, db: Session = Depends(get_db)
 ) -> User:
     """
@@ -134,7 +137,7 @@ async def update_user(
 
 
 @router.delete("/{user_id}")
-async def delete_user(user_id: int, db: Session = Depends(get_db)) -> dict:
+def delete_user(user_id: int, db: Session = Depends(get_db)) -> dict:
     """
     Удаление пользователя.
 
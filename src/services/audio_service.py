@@ -5,12 +5,17 @@
 здесь содержалась бы логика сохранения/валидации/запусков задач AI и т.п.
 """
 
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
+from sqlalchemy import delete, func, insert
 from sqlalchemy.orm import Session
 
 from src.models.audio_files import AudioFile
-from src.models.enums import Status
+from src.models.enums import STATUS_BY_VALUE, ProcessingStatus, Status
+from src.models.transcriptions import Transcription
+
+# Размер пачки строк для одного многострочного INSERT
+BULK_INSERT_CHUNK_SIZE = 1000
 
 
 class AudioService:
@@ -20,44 +25,135 @@ class AudioService:
     """
 
     @staticmethod
-    def create_audio_record(db: Session, filename: str, original_filename: str, file_size: int, user_id: Optional[int] = None, duration: Optional[float] = None, status: str = "uploaded") -> AudioFile:
-        try:
-            status_enum = Status(status)
-        except Exception:
-            status_enum = Status.UPLOADED
-
-        db_audio_file = AudioFile()
-        db_audio_file.filename = filename
-        db_audio_file.original_filename = original_filename
-        db_audio_file.file_size = file_size
-        db_audio_file.duration = duration
-        db_audio_file.status = status_enum
-        db_audio_file.user_id = user_id
-        db.add(db_audio_file)
+    def create_audio_record(db: Session, filename: str, original_filename: str, file_size: int, user_id: Optional[int] = None, duration: Optional[float] = None, status: str = "uploaded", transcription_language: Optional[str] = None, *, filepath: str, format: str, transcription_ai_model_id: Optional[int] = None) -> AudioFile:
+        """Создать запись об аудиофайле.
+
+        Если передан `transcription_language`, в той же транзакции создаётся
+        ожидающая транскрибация файла моделью `transcription_ai_model_id` —
+        обе записи фиксируются одним commit.
+
+        Raises:
+            ValueError: Если задан язык транскрибации без AI модели.
+        """
+        if transcription_language is not None and transcription_ai_model_id is None:
+            raise ValueError("transcription_ai_model_required")
+        status_enum = STATUS_BY_VALUE.get(status, Status.UPLOADED)
+
+        # INSERT ... RETURNING возвращает строку вместе со значениями по
+        # умолчанию (id, add_time) без отдельного SELECT после commit
+        stmt = (
+            insert(AudioFile)
+            .values(
+                filename=filename,
+                original_filename=original_filename,
+                filepath=filepath,
+                format=format,
+                file_size=file_size,
+                duration=duration,
+                status=status_enum,
+                user_id=user_id,
+            )
+            .returning(AudioFile)
+        )
+        db_audio_file = db.scalars(stmt).one()
+        if transcription_language is not None:
+            db_transcription = Transcription()
+            db_transcription.audio_file_id = db_audio_file.id
+            db_transcription.ai_model_id = transcription_ai_model_id
+            db_transcription.language = transcription_language
+            # Текст и границы сегмента еще не известны (NOT NULL столбцы)
+            db_transcription.text_transcription = ""
+            db_transcription.start_time = 0.0
+            db_transcription.end_time = duration or 0.0
+            db_transcription.status = ProcessingStatus.PENDING
+            db.add(db_transcription)
         db.commit()
-        db.refresh(db_audio_file)
         return db_audio_file
 
     @staticmethod
-    def delete_audio_record(db: Session, file_id: int) -> None:
-        audio_file = db.query(AudioFile).filter(AudioFile.id == file_id).first()
-        if not audio_file:
+    def bulk_create_audio_records(db: Session, records: List[Dict[str, Any]], user_id: Optional[int] = None) -> List[int]:
+        """Создаёт записи об аудиофайлах пачками и фиксирует их одним commit.
+
+        Строки передаются словарями, минуя unit of work ORM: каждая пачка
+        из BULK_INSERT_CHUNK_SIZE строк уходит одним INSERT ... RETURNING id.
+
+        Args:
+            db: Сессия базы данных.
+            records: Поля записей (filename, original_filename, filepath,
+                format, file_size, duration, status).
+            user_id: ID пользователя-владельца всех записей.
+
+        Returns:
+            List[int]: ID созданных записей в порядке `records`.
+        """
+        rows = []
+        for record in records:
+            status_enum = STATUS_BY_VALUE.get(record.get("status"), Status.UPLOADED)
+            rows.append(
+                {
+                    "filename": record["filename"],
+                    "original_filename": record.get("original_filename"),
+                    "filepath": record["filepath"],
+                    "format": record["format"],
+                    "file_size": record.get("file_size"),
+                    "duration": record.get("duration"),
+                    "status": status_enum,
+                    "user_id": user_id,
+                }
+            )
+
+        stmt = insert(AudioFile).returning(AudioFile.id, sort_by_parameter_order=True)
+        ids: List[int] = []
+        for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+            ids.extend(db.scalars(stmt, rows[start:start + BULK_INSERT_CHUNK_SIZE]))
+        db.commit()
+        return ids
+
+    @staticmethod
+    def delete_audio_record(db: Session, file_id: int) -> str:
+        """Удалить запись одним DELETE ... RETURNING и вернуть путь к файлу.
+
+        Связанные транскрибации удаляет БД (ON DELETE CASCADE).
+
+        Raises:
+            LookupError: Если записи нет.
+        """
+        deleted = db.execute(
+            delete(AudioFile)
+            .where(AudioFile.id == file_id)
+            .returning(AudioFile.filepath)
+            .execution_options(synchronize_session=False)
+        ).first()
+        if deleted is None:
             raise LookupError("not_found")
-        db.delete(audio_file)
         db.commit()
+        return deleted.filepath
 
     @staticmethod
     def get_stats(db: Session) -> dict:
-        total_files = db.query(AudioFile).count()
-        total_size = db.query(AudioFile).with_entities(AudioFile.file_size).all()
-        total_size_bytes = sum(size[0] for size in total_size if size[0])
-        status_stats = db.query(AudioFile.status, AudioFile.file_size).all()
+        # Агрегаты считаются в PostgreSQL одним запросом: ROLLUP добавляет
+        # к строкам по статусам итоговую строку (grouping(status) = 1)
+        rows = (
+            db.query(
+                func.grouping(AudioFile.status),
+                AudioFile.status,
+                func.count(AudioFile.id),
+                func.coalesce(func.sum(AudioFile.file_size), 0),
+            )
+            .group_by(func.rollup(AudioFile.status))
+            .all()
+        )
+        total_files = 0
+        total_size_bytes = 0
+        status_distribution = {}
+        for is_total, status, count, size in rows:
+            if is_total:
+                total_files, total_size_bytes = count, int(size)
+            else:
+                status_distribution[status] = count
         return {
             "total_files": total_files,
             "total_size_bytes": total_size_bytes,
             "total_size_mb": round(total_size_bytes / (1024 * 1024), 2),
-            "status_distribution": {
-                status: len([f for f, _ in status_stats if f == status])
-                for status in set(s[0] for s in status_stats)
-            },
+            "status_distribution": status_distribution,
         }
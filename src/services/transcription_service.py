@@ -0,0 +1,60 @@
+"""
+Сервис для колоночного представления сегментов транскрибации.
+
+Собирает сегменты аудиофайла из таблицы transcriptions в одну строку
+transcription_segments (массивы границ и текстов) при каждом изменении
+транскрибаций.
+"""
+
+from typing import Any, Optional
+
+from sqlalchemy import delete, func, insert, lambda_stmt, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session
+
+from src.models.transcription_segments import TranscriptionSegments
+from src.models.transcriptions import Transcription
+
+
+def _ordered_array(column: Any) -> Any:
+    """array_agg по столбцу в порядке id транскрибаций."""
+    return func.array_agg(aggregate_order_by(column, Transcription.id))
+
+
+class TranscriptionService:
+    @staticmethod
+    def refresh_segments(db: Session, audio_file_id: int) -> None:
+        """Пересобрать массивы сегментов аудиофайла (без commit).
+
+        Вызывается при каждом изменении транскрибаций в той же транзакции,
+        поэтому чтение сегментов ничего не пишет в БД. Старая строка
+        удаляется, новая собирается одним INSERT ... SELECT; если
+        транскрибаций не осталось, строка не создается.
+        """
+        db.execute(
+            lambda_stmt(
+                lambda: delete(TranscriptionSegments).where(
+                    TranscriptionSegments.audio_file_id == audio_file_id
+                )
+            )
+        )
+        source = (
+            select(
+                Transcription.audio_file_id,
+                _ordered_array(Transcription.start_time),
+                _ordered_array(Transcription.end_time),
+                _ordered_array(Transcription.text_transcription),
+            )
+            .where(Transcription.audio_file_id == audio_file_id)
+            .group_by(Transcription.audio_file_id)
+        )
+        db.execute(
+            insert(TranscriptionSegments).from_select(
+                ["audio_file_id", "start_times", "end_times", "texts"], source
+            )
+        )
+
+    @staticmethod
+    def get_segments(db: Session, audio_file_id: int) -> Optional[TranscriptionSegments]:
+        """Вернуть массивы сегментов аудиофайла (None, если транскрибаций нет)."""
+        return db.get(TranscriptionSegments, audio_file_id)
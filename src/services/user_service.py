@@ -8,6 +8,8 @@
 
 from typing import Optional
 
+from sqlalchemy import delete, lambda_stmt, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from src.models.users import User
@@ -15,40 +17,80 @@ from src.utils.security import hash_password
 
 
 class UserService:
+    @staticmethod
+    def get_by_username(db: Session, username: str) -> Optional[User]:
+        """Найти пользователя по имени.
+
+        Запрос выполняется при каждом входе, поэтому он собран через
+        lambda_stmt: SQL кэшируется по коду лямбды, а `username`
+        передаётся связанным параметром.
+        """
+        stmt = lambda_stmt(lambda: select(User).where(User.username == username))
+        return db.scalars(stmt).first()
+
     @staticmethod
     def create_user(db: Session, username: str, password: str, is_admin: bool = False) -> User:
-        """Создать пользователя, хэшируя пароль и сохранив запись в БД."""
-        existing = db.query(User).filter(User.username == username).first()
-        if existing:
-            raise ValueError("user_exists")
+        """Создать пользователя, хэшируя пароль и сохранив запись в БД.
 
-        # create user via attribute assignment to satisfy SQLAlchemy mypy plugin
-        user = User()
-        user.username = username
-        user.is_admin = is_admin
-        user.password_hash = hash_password(password)
+        Занятость имени проверяет сам INSERT (ON CONFLICT DO NOTHING по
+        уникальному username): один запрос вместо SELECT + INSERT.
 
-        db.add(user)
+        Raises:
+            ValueError: Если пользователь с таким именем уже существует.
+        """
+        stmt = (
+            insert(User)
+            .values(
+                username=username,
+                is_admin=is_admin,
+                password_hash=hash_password(password),
+            )
+            .on_conflict_do_nothing(index_elements=[User.username])
+            .returning(User)
+        )
+        user = db.scalars(stmt).first()
+        if user is None:
+            raise ValueError("user_exists")
         db.commit()
-        db.refresh(user)
         return user
 
     @staticmethod
     def update_user(db: Session, user_id: int, username: str, is_admin: Optional[bool] = None) -> User:
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            raise LookupError("not_found")
-        user.username = username
+        """Обновить пользователя одним UPDATE ... RETURNING.
+
+        Raises:
+            LookupError: Если пользователя нет.
+        """
+        values: dict = {"username": username}
         if is_admin is not None:
-            user.is_admin = is_admin
+            values["is_admin"] = is_admin
+        user = db.scalar(
+            update(User)
+            .where(User.id == user_id)
+            .values(**values)
+            .returning(User)
+            .execution_options(synchronize_session=False)
+        )
+        if user is None:
+            raise LookupError("not_found")
         db.commit()
-        db.refresh(user)
         return user
 
     @staticmethod
     def delete_user(db: Session, user_id: int) -> None:
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
+        """Удалить пользователя одним DELETE ... RETURNING.
+
+        user_id его аудиофайлов обнуляет БД (ON DELETE SET NULL).
+
+        Raises:
+            LookupError: Если пользователя нет.
+        """
+        deleted_id = db.scalar(
+            delete(User)
+            .where(User.id == user_id)
+            .returning(User.id)
+            .execution_options(synchronize_session=False)
+        )
+        if deleted_id is None:
             raise LookupError("not_found")
-        db.delete(user)
         db.commit()
@@ -4,21 +4,26 @@
 safe_remove(path) — безопасно удаляет файл, если он существует.
 """
 
+import logging
 import os
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 
 def safe_remove(path: Optional[str]) -> None:
     """Удаляет файл по пути `path`, если он существует.
 
-    Ничего не делает, если путь пустой или файла нет.
+    Ничего не делает, если путь пустой или файла нет. Один вызов unlink
+    вместо exists + remove: меньше системных вызовов и нет гонки между
+    проверкой и удалением.
     """
 
     if not path:
         return
     try:
-        if os.path.exists(path):
-            os.remove(path)
-    except Exception:
-        # логирование можно добавить здесь
-        pass
+        os.unlink(path)
+    except FileNotFoundError:
+        return
+    except OSError as e:
+        logger.warning(f"Не удалось удалить файл {path}: {e}")
@@ -0,0 +1,66 @@
+"""
+Утилиты для keyset-пагинации списков.
+
+Курсор — непрозрачная строка (base64 от id последней записи страницы).
+Страница выбирается условием `id > last_id ORDER BY id LIMIT n`,
+которое использует индекс вместо пропуска `skip` строк через OFFSET.
+Порядок (по возрастанию id, т. е. в порядке добавления) одинаков для
+курсора и для `skip`.
+"""
+
+import base64
+from typing import Any, Optional, Sequence
+
+from fastapi import HTTPException, Response
+
+# Заголовок ответа с курсором следующей страницы
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(last_id: int) -> str:
+    """Закодировать id последней записи страницы в курсор."""
+    return base64.urlsafe_b64encode(str(last_id).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """Раскодировать курсор в id последней записи предыдущей страницы.
+
+    Raises:
+        HTTPException: Если курсор некорректен.
+    """
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Некорректный курсор")
+
+
+def paginate(query: Any, id_column: Any, cursor: Optional[str], skip: int, limit: int) -> Any:
+    """Применить к запросу сортировку по id (в порядке добавления) и пагинацию.
+
+    С курсором используется keyset (`id > last_id`), без него — OFFSET
+    `skip` (для обратной совместимости; первая страница — `skip=0`).
+    Порядок по возрастанию id сохраняет прежний порядок выдачи для
+    клиентов, которые листают через `skip`.
+
+    Args:
+        query: Query или select(), поддерживающий where/order_by/offset/limit.
+        id_column: Столбец первичного ключа модели.
+        cursor: Курсор из заголовка X-Next-Cursor предыдущей страницы.
+        skip: Количество записей для пропуска, если курсор не задан.
+        limit: Максимальное количество записей.
+
+    Returns:
+        Any: Запрос того же типа с условиями пагинации.
+    """
+    query = query.order_by(id_column)
+    if cursor is not None:
+        query = query.where(id_column > decode_cursor(cursor))
+    elif skip:
+        query = query.offset(skip)
+    return query.limit(limit)
+
+
+def set_next_cursor(response: Response, rows: Sequence[Any], limit: int) -> None:
+    """Записать в заголовок ответа курсор следующей страницы, если она может быть."""
+    if rows and len(rows) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].id)
@@ -1,16 +1,110 @@
 """
 Безопасные утилиты: хеширование и проверка паролей.
 
-Оборачиваем конкретную реализацию (passlib) чтобы не разводить вызовы
-bcrypt по модели/сервисам напрямую.
+Оборачиваем конкретную реализацию (argon2-cffi, пакет bcrypt для старых
+хэшей) чтобы не разводить вызовы по модели/сервисам напрямую.
 """
 
-from passlib.hash import bcrypt
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import bcrypt
+from argon2 import PasswordHasher, Type
+from argon2.exceptions import InvalidHashError, VerificationError
+
+# Параметры Argon2id для новых хэшей. Параметры записываются в сам хэш,
+# поэтому задаются явно, а не выводятся из числа ядер конкретной машины:
+# иначе хэши пересчитывались бы при каждом переезде на другой хост
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "3"))
+ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", "65536"))  # KiB
+ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", "2"))
+
+_ARGON2 = PasswordHasher(
+    time_cost=ARGON2_TIME_COST,
+    memory_cost=ARGON2_MEMORY_COST,
+    parallelism=ARGON2_PARALLELISM,
+    type=Type.ID,
+)
+
+# Хэширование нагружает CPU: каждый хэш занимает ARGON2_PARALLELISM ядер,
+# поэтому одновременно выполняем не больше хэшей, чем помещается в ядра,
+# чтобы всплеск логинов не вытеснял обработку остальных запросов.
+# Потоков достаточно: argon2-cffi и bcrypt отпускают GIL на время вычисления
+_HASH_POOL = ThreadPoolExecutor(
+    max_workers=max(1, (os.cpu_count() or 1) // ARGON2_PARALLELISM),
+    thread_name_prefix="password-hash",
+)
+
+_ARGON2_PREFIX = "$argon2id$"
+
+# Хэш bcrypt (пользователи до перехода на Argon2id): префикс варианта и
+# ровно 60 символов
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+_BCRYPT_HASH_LENGTH = 60
+
+
+def _is_bcrypt_hash(password_hash: str) -> bool:
+    """Дешевая проверка формы bcrypt-хэша."""
+    return (
+        len(password_hash) == _BCRYPT_HASH_LENGTH
+        and password_hash.startswith(_BCRYPT_PREFIXES)
+    )
+
+
+def _is_known_hash(password_hash: str) -> bool:
+    """Дешевая проверка формы хэша до запуска KDF."""
+    return password_hash.startswith(_ARGON2_PREFIX) or _is_bcrypt_hash(password_hash)
+
+
+def _hash(password: str) -> str:
+    return _ARGON2.hash(password)
+
+
+def _verify(password: str, password_hash: str) -> bool:
+    if _is_bcrypt_hash(password_hash):
+        return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("ascii"))
+    try:
+        return _ARGON2.verify(password_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+# Заранее вычисленный корректный хэш для проверки пароля несуществующего
+# пользователя: время ответа не выдает, есть ли такой пользователь, а
+# хэш не пересчитывается при каждом промахе
+_DUMMY_HASH = _hash("!" * 16)
 
 
 def hash_password(password: str) -> str:
-    return bcrypt.hash(password)
+    return _HASH_POOL.submit(_hash, password).result()
 
 
 def verify_password(password: str, password_hash: str) -> bool:
-    return bool(bcrypt.verify(password, password_hash))
+    # Пустой или поврежденный хэш не может совпасть: не тратим на него KDF
+    if not password_hash or not _is_known_hash(password_hash):
+        return False
+    return bool(_HASH_POOL.submit(_verify, password, password_hash).result())
+
+
+def verify_or_dummy(password: str, password_hash: Optional[str]) -> bool:
+    """Проверяет пароль; без хэша (нет пользователя) тратит то же время и возвращает False."""
+    if password_hash is None:
+        verify_password(password, _DUMMY_HASH)
+        return False
+    return verify_password(password, password_hash)
+
+
+def password_needs_rehash(password_hash: str) -> bool:
+    """
+    Проверяет, нужно ли пересчитать хэш при успешном входе.
+
+    Старые bcrypt-хэши и хэши Argon2id с другими параметрами пересчитываются,
+    так что пользователи переходят на текущие настройки без отдельной миграции.
+    """
+    if not password_hash.startswith(_ARGON2_PREFIX):
+        return True
+    try:
+        return _ARGON2.check_needs_rehash(password_hash)
+    except InvalidHashError:
+        return True
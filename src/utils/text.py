@@ -17,5 +17,10 @@ def truncate(text: Optional[str], length: int = 100) -> str:
     if not text:
         return ""
     if len(text) <= length:
+        # Усечения нет — возвращаем исходную строку без копирования
         return text
-    return text[: max(0, length - 3)] + "..."
+    cut = length - 3
+    if cut > 0:
+        return text[:cut] + "..."
+    # Лимит короче многоточия: результат не длиннее `length`
+    return "..."[:max(0, length)]